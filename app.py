@@ -1,13 +1,289 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
-from pathlib import Path
 import os
 
+if __name__ == "__main__" and not os.environ.get("MOBILYTIX_DEBUG"):
+    # Patch blocking I/O into cooperative greenlets before anything else loads
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, Response, g, request, session, redirect, url_for, flash, jsonify, abort, stream_with_context
+from asgiref.wsgi import WsgiToAsgi
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import re
+import secrets
+import tempfile
+import uuid
+
 from modules.ai.ai_indexer import SessionIndexer
 from modules.ai.ai_query import AIQueryEngine
 from modules.ai.ai_reporter import ForensicReporter
+from modules.ai.ai_cache import SemanticCache
 
 app = Flask(__name__)
-app.secret_key = "mobilytix_secret"  # change if needed
+# Without a configured key, a random one per start: cookies from an
+# earlier run (and forged ones) simply stop being valid
+app.secret_key = os.environ.get("MOBILYTIX_SECRET_KEY") or os.urandom(32)
+app.config.update(SESSION_COOKIE_HTTPONLY=True, SESSION_COOKIE_SAMESITE="Lax")
+
+# ASGI entrypoint for async servers, e.g. `hypercorn app:asgi_app --workers 4`
+asgi_app = WsgiToAsgi(app)
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+# Constructing these opens the session's Chroma store, so keep warm
+# instances per process instead of rebuilding them on every request.
+@lru_cache(maxsize=8)
+def _indexer(session_path):
+    return SessionIndexer(session_path)
+
+
+@lru_cache(maxsize=8)
+def _engine(api_key, session_path):
+    return AIQueryEngine(api_key, session_path)
+
+
+@lru_cache(maxsize=8)
+def _reporter(api_key, session_path):
+    return ForensicReporter(api_key, session_path)
+
+
+@lru_cache(maxsize=32)
+def _validate_session_folder(folder):
+    """
+    Canonical absolute path of an existing session folder.
+
+    Raises (and so caches nothing) for missing or non-directory paths, so a
+    folder created after a failed attempt is picked up on the next one.
+    """
+    if not folder:
+        raise ValueError("no session folder given")
+    path = Path(folder).resolve(strict=True)
+    if not path.is_dir():
+        raise NotADirectoryError(str(path))
+    return str(path)
+
+
+@lru_cache(maxsize=None)
+def _template(name):
+    return app.jinja_env.get_template(name)
+
+
+def _render(name, **context):
+    """render_template() minus the per-call template lookup."""
+    app.update_template_context(context)
+    return _template(name).render(context)
+
+
+@lru_cache(maxsize=1)
+def _home_page():
+    """index.html rendered once (without flashes), plus its strong ETag."""
+    html = _render("index.html")
+    return html, hashlib.md5(html.encode("utf-8")).hexdigest()
+
+
+def _run_indexing(session_path):
+    _indexer(session_path).index_all()
+    # Readers opened before the re-index may hold a stale view of the store
+    _engine.cache_clear()
+    _reporter.cache_clear()
+    # Answers cached against the old index may no longer hold
+    SemanticCache(session_path).clear()
+
+
+MIN_QUESTION_CHARS = 3
+MAX_QUESTION_CHARS = 2000
+_URL_ONLY_RE = re.compile(r"^(?:https?://|www\.)\S+$", re.IGNORECASE)
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
+def _question_error(question):
+    """
+    Message for questions not worth an embedding + LLM roundtrip, else None.
+    """
+    q = (question or "").strip()
+    if len(q) < MIN_QUESTION_CHARS:
+        return "Please enter a question."
+    if len(q) > MAX_QUESTION_CHARS:
+        return f"Question is too long (max {MAX_QUESTION_CHARS} characters)."
+    if _CONTROL_CHARS_RE.search(q):
+        return "Question contains unsupported control characters."
+    if _URL_ONLY_RE.match(q):
+        return "Please ask a question about the session rather than pasting a link."
+    return None
+
+
+def _answer_question(api_key, session_path, question, use_cache=True):
+    """Answer from the semantic cache when possible, else ask the engine."""
+    if not use_cache or not (question or "").strip():
+        return _engine(api_key, session_path).query(question)
+
+    cache = SemanticCache(session_path)
+    cached, emb = cache.lookup(question)
+    if cached is not None:
+        return cached
+
+    answer = _engine(api_key, session_path).query(question)
+    cache.store(question, emb, answer)
+    return answer
+
+
+def _stream_answer(api_key, session_path, question, use_cache=True):
+    """Generator twin of _answer_question() that yields answer chunks."""
+    if not use_cache or not (question or "").strip():
+        yield from _engine(api_key, session_path).stream(question)
+        return
+
+    cache = SemanticCache(session_path)
+    cached, emb = cache.lookup(question)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    for token in _engine(api_key, session_path).stream(question):
+        parts.append(token)
+        yield token
+    cache.store(question, emb, "".join(parts))
+
+
+def _sse(data, event=None):
+    """Format one Server-Sent Event; multi-line data needs a data: per line."""
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+# -----------------------------
+# Background Indexing Jobs
+# -----------------------------
+# Job state lives on disk so any worker process can answer a status poll
+JOBS_DIR = Path(tempfile.gettempdir()) / "mobilytix_jobs"
+INDEX_WORKERS = 2
+_index_pool = None
+
+
+def _job_file(job_id):
+    return JOBS_DIR / f"{job_id}.json"
+
+
+def _write_job(job_id, **state):
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = _job_file(job_id).with_suffix(".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    tmp.replace(_job_file(job_id))
+
+
+def _read_job(job_id):
+    try:
+        return json.loads(_job_file(job_id).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        # os.kill(pid, 0) would terminate the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (OSError, TypeError, ValueError):
+        # Not ours to signal, or no pid recorded: assume it's still running
+        return True
+    return True
+
+
+def _fail_orphaned_jobs():
+    """
+    Mark jobs left "queued"/"started" by a worker that has since died
+    (killed by a timeout, crashed, restarted) as failed, so status polls
+    stop waiting on them.
+    """
+    if not JOBS_DIR.is_dir():
+        return
+    for path in JOBS_DIR.glob("*.json"):
+        job = _read_job(path.stem)
+        if job is None or job.get("status") not in ("queued", "started"):
+            continue
+        if _pid_alive(job.get("pid")):
+            continue
+        _write_job(path.stem, status="failed", session_path=job.get("session_path"),
+                   error="indexing worker exited before the job finished")
+
+
+def _indexing_job(job_id, session_path):
+    _write_job(job_id, status="started", session_path=session_path, pid=os.getpid())
+    try:
+        _run_indexing(session_path)
+    except Exception as e:
+        _write_job(job_id, status="failed", session_path=session_path, error=str(e))
+    else:
+        _write_job(job_id, status="finished", session_path=session_path)
+
+
+def _submit_indexing(fn, *args):
+    """
+    Run fn(*args) on a real OS thread. Under gevent's monkey patching (run()
+    and the gunicorn gevent worker) a ThreadPoolExecutor would run it as a
+    greenlet, and CPU-bound embedding never yields: the worker would serve
+    nothing else until it finished. gevent's own thread pool uses native
+    threads, so the hub keeps serving requests (and status polls) meanwhile.
+    The pool is built on first use, after any patching has happened.
+    """
+    global _index_pool
+    if _index_pool is None:
+        try:
+            from gevent import monkey
+            patched = monkey.is_module_patched("threading")
+        except ImportError:
+            patched = False
+        if patched:
+            from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+            _index_pool = NativeThreadPoolExecutor(max_workers=INDEX_WORKERS)
+        else:
+            _index_pool = ThreadPoolExecutor(max_workers=INDEX_WORKERS, thread_name_prefix="indexer")
+    _index_pool.submit(fn, *args)
+
+
+def enqueue_indexing(session_path):
+    """Queue a session for indexing and return its job id."""
+    job_id = uuid.uuid4().hex
+    _write_job(job_id, status="queued", session_path=session_path, pid=os.getpid())
+    _submit_indexing(_indexing_job, job_id, session_path)
+    return job_id
+
+
+_fail_orphaned_jobs()
+
+
+# -----------------------------
+# Request Context
+# -----------------------------
+# Chosen (session_path, api_key) per browser, kept server-side; the cookie
+# carries only an opaque id into this map
+_SESSIONS = {}
+
+# Endpoints usable before a session folder has been chosen
+_PUBLIC_ENDPOINTS = {"home", "select_session", "index_status", "static"}
+
+
+@app.before_request
+def _load_session_context():
+    """Read the chosen session once per request instead of in every view."""
+    g.session_path, g.api_key = _SESSIONS.get(session.get("sid"), (None, None))
+
+    if request.endpoint is None or request.endpoint in _PUBLIC_ENDPOINTS:
+        return
+    if not (g.session_path and g.api_key):
+        flash("Select a session folder first.", "danger")
+        return redirect("/")
 
 
 # -----------------------------
@@ -15,7 +291,14 @@ app.secret_key = "mobilytix_secret"  # change if needed
 # -----------------------------
 @app.route("/")
 def home():
-    return render_template("index.html")
+    # Flashed messages make the page differ per request; only the plain page is cached
+    if session.get("_flashes"):
+        return _render("index.html")
+
+    html, etag = _home_page()
+    resp = Response(html, mimetype="text/html")
+    resp.set_etag(etag)
+    return resp.make_conditional(request)
 
 
 # -----------------------------
@@ -26,15 +309,22 @@ def select_session():
     folder = request.form.get("session_folder")
     api_key = request.form.get("groq_api_key")
 
-    if not folder or not os.path.isdir(folder):
-        flash("Invalid session folder.", "danger")
-        return redirect("/")
+    # Errors render the home page directly: no redirect roundtrip or flash cookie
+    try:
+        folder = _validate_session_folder(folder)
+    except (OSError, ValueError):
+        return _render("index.html", error="Invalid session folder."), 400
 
     if not api_key:
-        flash("Groq API key required.", "danger")
-        return redirect("/")
+        return _render("index.html", error="Groq API key required."), 400
 
-    return redirect(url_for("session_menu", session_path=folder, api_key=api_key))
+    # Keep the key out of URLs, history, access logs, Referer headers and
+    # the (signed, not encrypted) cookie
+    sid = session.get("sid")
+    if sid not in _SESSIONS:
+        sid = session["sid"] = secrets.token_urlsafe(32)
+    _SESSIONS[sid] = (folder, api_key)
+    return redirect(url_for("session_menu"))
 
 
 # -----------------------------
@@ -42,9 +332,8 @@ def select_session():
 # -----------------------------
 @app.route("/session")
 def session_menu():
-    session_path = request.args.get("session_path")
-    api_key = request.args.get("api_key")
-    return render_template("indexer.html", session_path=session_path, api_key=api_key)
+    session_path = g.session_path
+    return _render("indexer.html", session_path=session_path)
 
 
 # -----------------------------
@@ -52,14 +341,23 @@ def session_menu():
 # -----------------------------
 @app.route("/index_session")
 def index_session():
-    session_path = request.args.get("session_path")
-    api_key = request.args.get("api_key")
+    session_path = g.session_path
 
-    indexer = SessionIndexer(session_path)
-    indexer.index_all()
+    job_id = enqueue_indexing(session_path)
 
-    flash("Indexing completed successfully!", "success")
-    return redirect(url_for("session_menu", session_path=session_path, api_key=api_key))
+    flash(f"Indexing started; job={job_id}", "info")
+    return redirect(url_for("session_menu"))
+
+
+# -----------------------------
+# Indexing Status
+# -----------------------------
+@app.route("/index_status/<job_id>")
+def index_status(job_id):
+    job = _read_job(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job_id=job_id, **job)
 
 
 # -----------------------------
@@ -67,28 +365,61 @@ def index_session():
 # -----------------------------
 @app.route("/query")
 def query_page():
-    session_path = request.args.get("session_path")
-    api_key = request.args.get("api_key")
-    return render_template("query.html", session_path=session_path, api_key=api_key)
+    session_path = g.session_path
+    return _render("query.html", session_path=session_path)
 
 
 # -----------------------------
 # Run Query
 # -----------------------------
 @app.route("/ask", methods=["POST"])
-def ask():
+async def ask():
+    session_path, api_key = g.session_path, g.api_key
     question = request.form.get("question")
-    session_path = request.form.get("session_path")
-    api_key = request.form.get("api_key")
+    use_cache = not request.form.get("no_cache")
+
+    error = _question_error(question)
+    if error:
+        return _render("query.html",
+                       session_path=session_path,
+                       question=question,
+                       answer=error)
 
-    engine = AIQueryEngine(api_key, session_path)
-    answer = engine.query(question)
+    # LLM roundtrip is network-bound; run it off the event loop
+    answer = await asyncio.to_thread(_answer_question, api_key, session_path, question, use_cache)
 
-    return render_template("query.html",
-                           session_path=session_path,
-                           api_key=api_key,
-                           question=question,
-                           answer=answer)
+    return _render("query.html",
+                   session_path=session_path,
+                   question=question,
+                   answer=answer)
+
+
+# -----------------------------
+# Run Query (streamed)
+# -----------------------------
+@app.route("/ask_stream")
+def ask_stream():
+    # GET because the browser's EventSource cannot POST
+    session_path, api_key = g.session_path, g.api_key
+    question = request.args.get("question")
+    use_cache = not request.args.get("no_cache")
+    error = _question_error(question)
+
+    def events():
+        if error:
+            yield _sse(error)
+            yield _sse("", event="done")
+            return
+        try:
+            for token in _stream_answer(api_key, session_path, question, use_cache):
+                yield _sse(token)
+        except Exception as e:
+            yield _sse(str(e), event="error")
+        yield _sse("", event="done")
+
+    return Response(stream_with_context(events()),
+                    mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 
 # -----------------------------
@@ -96,27 +427,44 @@ def ask():
 # -----------------------------
 @app.route("/report")
 def report_page():
-    session_path = request.args.get("session_path")
-    api_key = request.args.get("api_key")
-    return render_template("report.html", session_path=session_path, api_key=api_key)
+    session_path = g.session_path
+    return _render("report.html", session_path=session_path)
 
 
 # -----------------------------
 # Generate Report
 # -----------------------------
 @app.route("/generate_report", methods=["POST"])
-def generate_report():
-    session_path = request.form.get("session_path")
-    api_key = request.form.get("api_key")
+async def generate_report():
+    session_path, api_key = g.session_path, g.api_key
 
-    reporter = ForensicReporter(api_key, session_path)
-    report_text = reporter.generate_report()
+    reporter = _reporter(api_key, session_path)
+    report_text = await asyncio.to_thread(reporter.generate_report)
+
+    return _render("report.html",
+                   session_path=session_path,
+                   report=report_text)
+
+
+# -----------------------------
+# Server
+# -----------------------------
+# Production: `gunicorn -c gunicorn_conf.py app:app` (see gunicorn_conf.py).
+# run() is a dependency-light fallback for running straight from a checkout.
+def run(host="127.0.0.1", port=8080):
+    """
+    Serve the app with gevent in this one process. Concurrency comes from
+    greenlets: each process would load its own embedding model and hold
+    its own view of the Chroma store, so there is no fork-per-CPU here.
+    """
+    from gevent.pywsgi import WSGIServer
 
-    return render_template("report.html",
-                           session_path=session_path,
-                           api_key=api_key,
-                           report=report_text)
+    WSGIServer((host, port), app).serve_forever()
 
 
 if __name__ == "__main__":
-    app.run(debug=True, port=8080)
+    if os.environ.get("MOBILYTIX_DEBUG"):
+        # Local debugging: Werkzeug reloader + debugger, no gevent
+        app.run(host="127.0.0.1", port=8080, debug=True)
+    else:
+        run()
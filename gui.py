@@ -1,14 +1,17 @@
+import importlib
 import os
+import re
+import time
 import webbrowser
+from itertools import islice
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QFileDialog, QTextEdit, QInputDialog, QTableWidget,
-    QTableWidgetItem, QLineEdit, QHeaderView, QScrollArea, QMessageBox
+    QFileDialog, QTextEdit, QPlainTextEdit, QInputDialog, QTableView,
+    QLineEdit, QHeaderView, QScrollArea, QMessageBox, QAbstractItemView
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QUrl
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+from PyQt6.QtGui import QFont, QTextDocument
 
 from modules.adb_utils import (
     timestamp, fname_timestamp, list_devices, list_apps, list_files,
@@ -18,7 +21,8 @@ from modules.adb_utils import (
     query_sms_live, query_contacts_live, query_calls_live,
     analyze_app, pull_apk, generate_app_report,
     pull_folder_with_metadata, archive_to_bin, run_adb,
-    perform_full_extraction, brute_extract_folder, detect_device_manufacturer
+    perform_full_extraction, brute_extract_folder, detect_device_manufacturer,
+    get_all_props
 )
 
 from modules.parsers import (
@@ -27,12 +31,74 @@ from modules.parsers import (
 )
 
 from modules.workers import Worker
+from modules.manifest_store import ManifestStore
+from modules.pdf_report import markdown_to_html, save_pdf
+from modules.table_model import TableModel, fold_text
 
 # Import new modules
 from modules.session_manager import SessionManager
 from modules.data_logger import DataLogger
-from modules.timeline_builder import TimelineBuilder
-from modules.timeline_visualizer import TimelineVisualizer
+
+# Extractions / BIN builds allowed to run at once (on their own pool)
+LONG_JOB_THREADS = 2
+
+# Shared by every sidebar button (applied once to the sidebar container)
+BTN_QSS = (
+    "QPushButton { background:#1E1E1E; border:1px solid #444; "
+    "color:white; font-size:14px; text-align:left; padding-left:8px; }"
+)
+
+# Header lines written by the live query helpers (see _extract_metadata_from_raw)
+_URI_RE = re.compile(r'# URI(?:\s+used)?:\s*(.+)')
+_PROJ_RE = re.compile(r'# Projection:\s*(.+)')
+
+# What run_adb() returns on failure: its own timeout/missing-binary/exception
+# messages, or adb's stderr ("adb: no devices/emulators found", "error: device
+# offline"). Never cached by _cached_adb()
+_ADB_ERR_RE = re.compile(r'adb command timed out|adb not found|adb error:|adb: |error: ')
+
+
+def _lists_a_device(devices_output):
+    """True if `adb devices -l` output has a device line under its header."""
+    return any(line.strip() for line in devices_output.splitlines()[1:])
+
+
+# Heavy backends (AI stack, ReportLab) are imported on first use; see _lazy()
+_LAZY = {}
+
+# What an AI session will need; warmed in the background once one is chosen
+_AI_MODULES = (
+    "modules.ai.ai_indexer", "modules.ai.ai_query", "modules.ai.ai_reporter",
+    "reportlab.platypus",
+)
+
+
+def _lazy(name):
+    """importlib.import_module(name), resolved once and kept for later calls"""
+    mod = _LAZY.get(name)
+    if mod is None:
+        mod = _LAZY[name] = importlib.import_module(name)
+    return mod
+
+
+def _warm_imports(names):
+    for name in names:
+        try:
+            _lazy(name)
+        except ImportError:
+            pass  # reported properly when the feature is actually used
+
+
+# Tables longer than this keep default row heights (see _after_populate)
+RESIZE_ROWS_MAX = 500
+
+# Table layout per parsed record type: (headers, record keys in column order)
+_SCHEMAS = {
+    "sms": (["Address", "Date", "Body"], ("address", "date", "body")),
+    "contacts": (["Name", "Number"], ("name", "number")),
+    "calls": (["Name", "Number", "Duration(s)", "Date"],
+              ("name", "number", "duration_seconds", "date")),
+}
 
 
 class MobilytixGUI(QWidget):
@@ -43,9 +109,21 @@ class MobilytixGUI(QWidget):
         self.setMinimumSize(1300, 780)
         self.setStyleSheet("background-color: #0F0F0F; color: white;")
 
-        self.workers = []
+        # Tasks run on the shared pool; the set only keeps in-flight Workers
+        # (and their signal objects) alive until their result is delivered
+        self.workers = set()
+        self.pool = QThreadPool.globalInstance()
+        # adb calls mostly block on I/O, so allow a few even on small machines
+        self.pool.setMaxThreadCount(max(4, os.cpu_count() or 1))
+        # Extractions, folder copies and BIN builds (minutes, or up to an
+        # hour for adb backup) get their own pool so they never hold the
+        # slots that quick actions (detect, listings, Save PDF) run on
+        self.long_pool = QThreadPool(self)
+        self.long_pool.setMaxThreadCount(LONG_JOB_THREADS)
         self.current_rows = []
         self._last_manifest = None
+        # Listing results by operation -> (monotonic time, result); see _cached_adb()
+        self._adb_cache = {}
         # AI forensic state
         self.ai_session_path = None
         self.ai_api_key = None
@@ -65,104 +143,81 @@ class MobilytixGUI(QWidget):
         sidebar.setAlignment(Qt.AlignmentFlag.AlignTop)
         sidebar.setSpacing(12)
 
-        def make_btn(text, handler):
-            b = QPushButton(text)
-            b.setFixedHeight(40)
-            b.setStyleSheet(
-                "background:#1E1E1E; border:1px solid #444; "
-                "color:white; font-size:14px; text-align:left; padding-left:8px;"
-            )
-            b.clicked.connect(handler)
-            return b
-
-        # ---------------- DEVICE INFO ----------------
-        lbl_device = QLabel("DEVICE INFO")
-        lbl_device.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_device)
-
-        sidebar.addWidget(make_btn("List Devices", lambda: self.run_plain(list_devices)))
-        sidebar.addWidget(make_btn("Device Info", self.ui_device_info))
-        sidebar.addWidget(make_btn("Battery Info", lambda: self.run_plain(get_battery_info)))
-        sidebar.addWidget(make_btn("Detect Manufacturer", self.ui_detect_manufacturer))
-        sidebar.addWidget(make_btn("Grant ADB Permissions", self.ui_grant_permissions))
-
-        sidebar.addSpacing(16)
-
-        # ---------------- FILES & APPS ----------------
-        lbl_files = QLabel("FILES & APPS")
-        lbl_files.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_files)
-
-        sidebar.addWidget(make_btn("List Apps", lambda: self.run_plain(list_apps)))
-        sidebar.addWidget(make_btn("List /sdcard/", lambda: self.run_plain(list_files)))
-        sidebar.addWidget(make_btn("Pull File", self.ui_pull))
-        sidebar.addWidget(make_btn("Screenshot", self.ui_screenshot))
-
-        sidebar.addSpacing(16)
-
-        # ---------------- EXTRACTION ----------------
-        lbl_extract = QLabel("EXTRACTION")
-        lbl_extract.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_extract)
-    
-        sidebar.addWidget(make_btn("Copy WhatsApp", self.ui_whatsapp))
-        sidebar.addWidget(make_btn("Copy Screenshots", self.ui_screenshots))
-        sidebar.addWidget(make_btn("Copy Camera", self.ui_camera))
-        sidebar.addWidget(make_btn("Dump SMS", self.ui_dump_sms))
-        sidebar.addWidget(make_btn("Dump Contacts", self.ui_dump_contacts))
-        sidebar.addWidget(make_btn("Dump Calls", self.ui_dump_calls))
-        sidebar.addWidget(make_btn("Full Device Extraction", self.ui_full_device_extraction))
-        sidebar.addWidget(make_btn("Extract Full Filesystem", self.ui_extract_full_fs))
-        sidebar.addWidget(make_btn("Extract Folder", self.ui_extract_folder))
-        sidebar.addWidget(make_btn("Create BIN from Last Extract", self.ui_create_bin_from_last))
-
-        sidebar.addSpacing(16)
-
-        # ---------------- APP FORENSICS ----------------
-        lbl_forensics = QLabel("APP FORENSICS")
-        lbl_forensics.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_forensics)
-
-        sidebar.addWidget(make_btn("Analyze App", self.ui_analyze))
-        sidebar.addWidget(make_btn("Pull APK", self.ui_pull_apk))
-        sidebar.addWidget(make_btn("Generate Report", self.ui_report))
-
-        sidebar.addSpacing(16)
-
-        # ---------------- DATA VIEWER ----------------
-        lbl_viewer = QLabel("DATA VIEWER")
-        lbl_viewer.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_viewer)
-
-        sidebar.addWidget(make_btn("View SMS", self.ui_view_sms))
-        sidebar.addWidget(make_btn("View Contacts", self.ui_view_contacts))
-        sidebar.addWidget(make_btn("View Call Logs", self.ui_view_calls))
-        sidebar.addWidget(make_btn("Load Dump File", self.ui_load_file))
-        
-        sidebar.addSpacing(16)
-
-        # ---------------- TIMELINE ----------------
-        lbl_timeline = QLabel("TIMELINE")
-        lbl_timeline.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_timeline)
-
-        sidebar.addWidget(make_btn("Generate Timeline", self.ui_generate_timeline))
-        sidebar.addWidget(make_btn("View Timeline", self.ui_view_timeline))
-        sidebar.addWidget(make_btn("View Sessions", self.ui_view_sessions))
+        # One stylesheet on the container styles every sidebar button, instead
+        # of parsing the same QSS once per button
+        sidebar_container.setStyleSheet(BTN_QSS)
+
+        sections = [
+            ("DEVICE INFO", [
+                ("List Devices", lambda: self.run_plain(
+                    lambda: self._cached_adb("list_devices", list_devices, ttl=10,
+                                             keep=_lists_a_device))),
+                ("Device Info", self.ui_device_info),
+                ("Battery Info", lambda: self.run_plain(get_battery_info)),
+                ("Detect Manufacturer", self.ui_detect_manufacturer),
+                ("Grant ADB Permissions", self.ui_grant_permissions),
+                ("Refresh Device Cache", self.ui_refresh_cache),
+            ]),
+            ("FILES & APPS", [
+                ("List Apps", lambda: self.run_plain(
+                    lambda: self._cached_adb("list_apps", list_apps))),
+                ("List /sdcard/", lambda: self.run_plain(
+                    lambda: self._cached_adb("list_files", list_files))),
+                ("Pull File", self.ui_pull),
+                ("Screenshot", self.ui_screenshot),
+            ]),
+            ("EXTRACTION", [
+                ("Copy WhatsApp", self.ui_whatsapp),
+                ("Copy Screenshots", self.ui_screenshots),
+                ("Copy Camera", self.ui_camera),
+                ("Dump SMS", self.ui_dump_sms),
+                ("Dump Contacts", self.ui_dump_contacts),
+                ("Dump Calls", self.ui_dump_calls),
+                ("Full Device Extraction", self.ui_full_device_extraction),
+                ("Extract Full Filesystem", self.ui_extract_full_fs),
+                ("Extract Folder", self.ui_extract_folder),
+                ("Create BIN from Last Extract", self.ui_create_bin_from_last),
+            ]),
+            ("APP FORENSICS", [
+                ("Analyze App", self.ui_analyze),
+                ("Pull APK", self.ui_pull_apk),
+                ("Generate Report", self.ui_report),
+            ]),
+            ("DATA VIEWER", [
+                ("View SMS", self.ui_view_sms),
+                ("View Contacts", self.ui_view_contacts),
+                ("View Call Logs", self.ui_view_calls),
+                ("Load Dump File", self.ui_load_file),
+            ]),
+            ("TIMELINE", [
+                ("Generate Timeline", self.ui_generate_timeline),
+                ("View Timeline", self.ui_view_timeline),
+                ("View Sessions", self.ui_view_sessions),
+            ]),
+            ("AI FORENSICS", [
+                ("Select Session Folder", self.ui_select_session_folder),
+                ("Set Groq API Key", self.ui_set_api_key),
+                ("Index Session", self.ui_index_session),
+                ("Ask AI", self.ui_query_ai),
+                ("Generate AI Report", self.ui_generate_ai_report),
+                ("Download Report as PDF", self.ui_save_pdf),
+            ]),
+        ]
 
-        sidebar.addSpacing(16)
+        section_font = QFont("Segoe UI", 12)
+        for n, (title, buttons) in enumerate(sections):
+            if n:
+                sidebar.addSpacing(16)
 
-        # ---------------- AI FORENSICS ----------------
-        lbl_ai = QLabel("AI FORENSICS")
-        lbl_ai.setFont(QFont("Segoe UI", 12))
-        sidebar.addWidget(lbl_ai)
+            lbl = QLabel(title)
+            lbl.setFont(section_font)
+            sidebar.addWidget(lbl)
 
-        sidebar.addWidget(make_btn("Select Session Folder", self.ui_select_session_folder))
-        sidebar.addWidget(make_btn("Set Groq API Key", self.ui_set_api_key))
-        sidebar.addWidget(make_btn("Index Session", self.ui_index_session))
-        sidebar.addWidget(make_btn("Ask AI", self.ui_query_ai))
-        sidebar.addWidget(make_btn("Generate AI Report", self.ui_generate_ai_report))
-        sidebar.addWidget(make_btn("Download Report as PDF", self.ui_save_pdf))
+            for text, handler in buttons:
+                b = QPushButton(text)
+                b.setFixedHeight(40)
+                b.clicked.connect(handler)
+                sidebar.addWidget(b)
 
 
         # Scroll setup
@@ -178,19 +233,33 @@ class MobilytixGUI(QWidget):
         # =====================================================================
         right_layout = QVBoxLayout()
         right_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._right_layout = right_layout
 
         # ----- Console -----
-        self.console = QTextEdit()
+        # Plain-text block model: no rich-text relayout per line, and old
+        # lines are dropped once the cap is reached
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
+        self.console.setUndoRedoEnabled(False)
+        self.console.setMaximumBlockCount(5000)
         self.console.setStyleSheet(
             "background:#111; color:#ddd; font-family:Consolas; font-size:13px;"
         )
         self.console.setFixedHeight(300)
 
+        # Lines are buffered and flushed together so chatty workers cost
+        # ~20 widget updates per second instead of one per line
+        self._console_buf = []
+        self._console_timer = QTimer(self)
+        self._console_timer.setInterval(50)
+        self._console_timer.timeout.connect(self._flush_console)
+        self._console_timer.start()
+
         right_layout.addWidget(self.console)
         # ----- AI MARKDOWN OUTPUT VIEW -----
         self.md_output = QTextEdit()
         self.md_output.setReadOnly(True)
+        self.md_output.setUndoRedoEnabled(False)
         self.md_output.setStyleSheet(
             "background:#111; color:white; font-family:Segoe UI; font-size:14px; padding:10px;"
         )
@@ -198,9 +267,9 @@ class MobilytixGUI(QWidget):
         right_layout.addWidget(self.md_output)
 
         # ----- Timeline HTML Viewer -----
-        self.timeline_view = QWebEngineView()
-        self.timeline_view.hide()
-        right_layout.addWidget(self.timeline_view, 1)
+        # Created on first use (see _ensure_timeline_view): QtWebEngine starts
+        # Chromium, which is heavy to pay for at startup
+        self.timeline_view = None
 
 
 
@@ -209,9 +278,17 @@ class MobilytixGUI(QWidget):
         # ----- Search Bar -----
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Filter table (press Enter)...")
+        self.search_input.setPlaceholderText("Filter table...")
         self.search_input.returnPressed.connect(self.filter_table)
 
+        # Filter as you type, but only once typing pauses for 150ms;
+        # start() restarts a running timer, so a burst costs one pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._live_filter)
+        self.search_input.textChanged.connect(self._filter_timer.start)
+
         clear_btn = QPushButton("Clear")
         clear_btn.clicked.connect(self.clear_search)
 
@@ -221,10 +298,19 @@ class MobilytixGUI(QWidget):
         right_layout.addLayout(search_layout)
 
         # ----- Table -----
-        self.table = QTableWidget(0, 1)
+        self.table = QTableView()
+        # One model for the window's lifetime; views are swapped by resetting
+        # it, and it filters itself (matching rows from its case-folded
+        # search buffer, shown through an index list)
+        self.model = TableModel(parent=self)
+        self.table.setModel(self.model)
         self.table.setStyleSheet("background:#111; color:#ddd;")
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
+        # Read-only everywhere: cells keep Qt's default Selectable|Enabled
+        # flags (TableModel doesn't override flags(), so no per-cell Python
+        # call) and the view never tries to open an editor
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
         right_layout.addWidget(self.table)
 
@@ -233,9 +319,33 @@ class MobilytixGUI(QWidget):
     # =====================================================================
     #                          SESSION MANAGEMENT
     # =====================================================================
+    def _cached_adb(self, key, fn, ttl=60, keep=None):
+        """
+        fn() result reused for `ttl` seconds under `key`, until ui_refresh_cache().
+        Errors, and results `keep` rejects, aren't kept, so the next click
+        retries once a device is attached.
+        """
+        now = time.monotonic()
+        hit = self._adb_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        res = fn()
+        if isinstance(res, str) and not _ADB_ERR_RE.match(res) and (keep is None or keep(res)):
+            self._adb_cache[key] = (now, res)
+        else:
+            self._adb_cache.pop(key, None)
+        return res
+
+    def ui_refresh_cache(self):
+        self._adb_cache.clear()
+        detect_device_manufacturer.cache_clear()
+        list_devices.cache_clear()
+        self._append_console("Device cache cleared.")
+
     def _initialize_session(self):
         """Initialize session on startup"""
         try:
+            # Memoized per adb shell session in adb_utils
             device_info = detect_device_manufacturer()
             session_dir = self.session_manager.start_session(device_info)
             self._append_console(f"✓ Session initialized: {session_dir.name}")
@@ -245,23 +355,22 @@ class MobilytixGUI(QWidget):
     # =====================================================================
     #                          WORKER UTILITIES
     # =====================================================================
-    def run_plain(self, fn):
+    def run_plain(self, fn, long_job=False):
         self._append_console("Running...")
         worker = Worker(fn)
-        self.workers.append(worker)
+        self.workers.add(worker)
 
         def finished(res):
             self._append_console(str(res))
-            if worker in self.workers:
-                self.workers.remove(worker)
+            self.workers.discard(worker)
 
         worker.finished.connect(finished)
-        worker.start()
+        (self.long_pool if long_job else self.pool).start(worker)
 
-    def run_with_callback(self, fn, callback):
+    def run_with_callback(self, fn, callback, long_job=False):
         self._append_console("Running...")
         worker = Worker(fn)
-        self.workers.append(worker)
+        self.workers.add(worker)
 
         def finished(res):
             self._append_console("Result received.")
@@ -272,28 +381,45 @@ class MobilytixGUI(QWidget):
                 import traceback
                 self._append_console(traceback.format_exc())
 
-            if worker in self.workers:
-                self.workers.remove(worker)
+            self.workers.discard(worker)
 
         worker.finished.connect(finished)
-        worker.start()
+        (self.long_pool if long_job else self.pool).start(worker)
     
     def ui_grant_permissions(self):
         from modules.adb_utils import grant_adb_permissions
         self.run_plain(grant_adb_permissions)
     
     def _append_console(self, text):
-        self.console.append(f"[{timestamp()}] {text}")
+        self._console_buf.append(text)
 
-    def display_markdown_output(self, md_text):
-        """Display Markdown-rendered output in the Raw Output section."""
+    def _flush_console(self):
+        if not self._console_buf:
+            return
+        # One timestamp per flush; lines are at most one 50ms tick old
+        prefix = f"[{timestamp()}] "
+        joined = prefix + f"\n{prefix}".join(self._console_buf)
+        self._console_buf.clear()
+        self.console.appendPlainText(joined)
+
+    def display_markdown_output(self, md_text, html=None):
+        """
+        Display Markdown-rendered output in the Raw Output section.
+        `html` is md_text pre-rendered in a worker (see markdown_to_html,
+        which also escapes raw HTML and strips non-data: images); without it
+        Qt parses the markdown here on the GUI thread, likewise without HTML.
+        """
         self.table.hide()            # Hide table
-        self.timeline_view.hide()
+        self._hide_timeline()
 
         self.md_output.show()        # Show markdown viewer
 
         try:
-            self.md_output.setMarkdown(md_text)
+            if html is not None:
+                self.md_output.setHtml(html)
+            else:
+                self.md_output.document().setMarkdown(
+                    md_text, QTextDocument.MarkdownFeature.MarkdownNoHTML)
         except Exception:
             # Fallback if markdown fails
             self.md_output.setPlainText(md_text)
@@ -310,8 +436,10 @@ class MobilytixGUI(QWidget):
     def ui_device_info(self):
         """Get device info and log it"""
         def fn():
-            info_text = get_device_info()
-            device_dict = detect_device_manufacturer()
+            # One getprop dump feeds both views of the device
+            props = get_all_props()
+            info_text = get_device_info(props)
+            device_dict = detect_device_manufacturer(props)
             
             # Log device info
             try:
@@ -324,6 +452,8 @@ class MobilytixGUI(QWidget):
     
     def ui_detect_manufacturer(self):
         def detect():
+            # Explicit detection always asks the device again
+            detect_device_manufacturer.cache_clear()
             info = detect_device_manufacturer()
             output = "Device Detection:\n"
             output += f"Manufacturer: {info['manufacturer']}\n"
@@ -362,17 +492,17 @@ class MobilytixGUI(QWidget):
     def ui_whatsapp(self):
         d = self.choose_folder()
         if d:
-            self.run_plain(lambda: copy_whatsapp(d))
+            self.run_plain(lambda: copy_whatsapp(d), long_job=True)
 
     def ui_screenshots(self):
         d = self.choose_folder()
         if d:
-            self.run_plain(lambda: copy_screenshots(d))
+            self.run_plain(lambda: copy_screenshots(d), long_job=True)
 
     def ui_camera(self):
         d = self.choose_folder()
         if d:
-            self.run_plain(lambda: copy_camera(d))
+            self.run_plain(lambda: copy_camera(d), long_job=True)
 
     def ui_dump_sms(self):
         d = self.choose_folder()
@@ -420,18 +550,16 @@ class MobilytixGUI(QWidget):
             return
 
         def fn():
-            return brute_extract_folder("/sdcard", d)
+            return self._spill_manifest(brute_extract_folder("/sdcard", d))
 
-        def cb(manifest):
-            if not isinstance(manifest, list):
+        def cb(res):
+            if not isinstance(res, tuple):
                 self._append_console("Filesystem extraction failed or limited permissions.")
                 return
-            self._last_manifest = manifest
-            headers, rows = manifest_to_table_rows(manifest)
-            self.populate_table(headers, rows)
-            self._append_console(f"Extracted {len(manifest)} files.")
+            self._show_manifest(res)
+            self._append_console(f"Extracted {len(self._last_manifest)} files.")
 
-        self.run_with_callback(fn, cb)
+        self.run_with_callback(fn, cb, long_job=True)
 
     def ui_extract_folder(self):
         remote, ok = QInputDialog.getText(self, "Remote Folder", "Remote folder (e.g. /sdcard/DCIM):")
@@ -443,17 +571,34 @@ class MobilytixGUI(QWidget):
             return
 
         def fn():
-            return brute_extract_folder(remote, d)
+            return self._spill_manifest(brute_extract_folder(remote, d))
 
-        def cb(manifest):
-            if not isinstance(manifest, list):
+        def cb(res):
+            if not isinstance(res, tuple):
                 self._append_console("No files found or permission denied.")
                 return
-            self._last_manifest = manifest
-            headers, rows = manifest_to_table_rows(manifest)
-            self.populate_table(headers, rows)
-
-        self.run_with_callback(fn, cb)
+            self._show_manifest(res)
+
+        self.run_with_callback(fn, cb, long_job=True)
+
+    @staticmethod
+    def _spill_manifest(manifest):
+        """
+        Worker side: write a manifest list to a temp ManifestStore (kept out
+        of the evidence folder) and build its table columns. The entry dicts
+        are dropped with the worker; the GUI keeps the store, for Create BIN,
+        and the table's string columns. Non-list results (errors) are passed
+        through unchanged.
+        """
+        if not isinstance(manifest, list):
+            return manifest
+        store = ManifestStore.write_temp(manifest)
+        return store, manifest_to_table_rows(manifest)
+
+    def _show_manifest(self, res):
+        store, (headers, columns) = res
+        self._last_manifest = store
+        self.populate_columns(headers, columns)
 
     def ui_create_bin_from_last(self):
         if not self._last_manifest:
@@ -465,7 +610,7 @@ class MobilytixGUI(QWidget):
             return
 
         out_path = os.path.join(d, f"mobilytix_dump_{fname_timestamp()}.bin")
-        self.run_plain(lambda: archive_to_bin(self._last_manifest, out_path))
+        self.run_plain(lambda: archive_to_bin(self._last_manifest, out_path), long_job=True)
 
     def ui_full_device_extraction(self):
         d = self.choose_folder()
@@ -473,22 +618,20 @@ class MobilytixGUI(QWidget):
             return
 
         def fn():
-            return perform_full_extraction(d)
+            return self._spill_manifest(perform_full_extraction(d))
 
         def cb(res):
             if isinstance(res, str):
                 self._append_console(res)
                 return
-            if not isinstance(res, list):
+            if not isinstance(res, tuple):
                 self._append_console("Extraction failed.")
                 return
 
-            self._last_manifest = res
-            headers, rows = manifest_to_table_rows(res)
-            self.populate_table(headers, rows)
-            self._append_console(f"Full device extraction: {len(res)} items.")
+            self._show_manifest(res)
+            self._append_console(f"Full device extraction: {len(self._last_manifest)} items.")
 
-        self.run_with_callback(fn, cb)
+        self.run_with_callback(fn, cb, long_job=True)
 
     # =====================================================================
     #                     VIEWER HANDLERS (WITH LOGGING)
@@ -514,7 +657,8 @@ class MobilytixGUI(QWidget):
     def _on_sms_callback(self, result):
         """Handle SMS result with logging info"""
         raw, parsed, log_file = result
-        self._on_sms_text(raw)
+        # fn() already parsed on the worker thread; don't parse again here
+        self._render_sms_rows(parsed, raw)
         if log_file:
             self._append_console(f"✓ SMS data logged to: {log_file}")
 
@@ -536,7 +680,8 @@ class MobilytixGUI(QWidget):
     def _on_contacts_callback(self, result):
         """Handle contacts result with logging info"""
         raw, parsed, log_file = result
-        self._on_contacts_text(raw)
+        # fn() already parsed on the worker thread; don't parse again here
+        self._render_contacts_rows(parsed, raw)
         if log_file:
             self._append_console(f"✓ Contacts data logged to: {log_file}")
 
@@ -558,20 +703,20 @@ class MobilytixGUI(QWidget):
     def _on_calls_callback(self, result):
         """Handle calls result with logging info"""
         raw, parsed, log_file = result
-        self._on_calls_text(raw)
+        # fn() already parsed on the worker thread; don't parse again here
+        self._render_calls_rows(parsed, raw)
         if log_file:
             self._append_console(f"✓ Call logs logged to: {log_file}")
 
     def _extract_metadata_from_raw(self, raw_text):
         """Extract URI and projection info from raw output"""
-        import re
         info = {}
         
-        uri_match = re.search(r'# URI(?:\s+used)?:\s*(.+)', raw_text)
+        uri_match = _URI_RE.search(raw_text)
         if uri_match:
             info['uri_used'] = uri_match.group(1).strip()
         
-        proj_match = re.search(r'# Projection:\s*(.+)', raw_text)
+        proj_match = _PROJ_RE.search(raw_text)
         if proj_match:
             info['projection_used'] = proj_match.group(1).strip()
         
@@ -583,81 +728,112 @@ class MobilytixGUI(QWidget):
             return
 
         try:
-            raw = open(path, "r", encoding="utf-8").read()
+            with open(path, "rb") as f:
+                # Auto-detect format from the head; only read the whole dump
+                # once we know a parser wants it
+                head_bytes = f.read(4096)
+                head = head_bytes.decode("utf-8", "replace")
+
+                if "address=" in head and "body=" in head:
+                    handler = self._on_sms_text
+                elif "display_name=" in head or "contact" in head.lower():
+                    handler = self._on_contacts_text
+                elif "duration=" in head and "date=" in head:
+                    handler = self._on_calls_text
+                else:
+                    handler = None
+
+                if handler is not None:
+                    raw = (head_bytes + f.read()).decode("utf-8")
+                else:
+                    f.seek(0)
+                    lines = [ln.decode("utf-8", "replace").rstrip("\r\n") for ln in islice(f, 100)]
         except Exception as e:
             self._append_console(f"Error reading file: {e}")
             return
 
-        # Auto-detect format based on content
-        if "address=" in raw and "body=" in raw:
-            self._on_sms_text(raw)
-        elif "display_name=" in raw or "contact" in raw.lower():
-            self._on_contacts_text(raw)
-        elif "duration=" in raw and "date=" in raw:
-            self._on_calls_text(raw)
+        if handler is not None:
+            handler(raw)
         else:
             self._append_console("Unknown format, showing raw data")
-            self.populate_table(["Raw"], [[ln] for ln in raw.splitlines()[:100]])
+            self.populate_table(["Raw"], [[ln] for ln in lines])
 
     # =====================================================================
     #                   PARSED CALLBACKS
     # =====================================================================
+    def _parse_in_background(self, parser, raw, render):
+        """Run parser(raw) on a Worker and hand (rows, raw) to render on the GUI thread"""
+        def done(rows):
+            if isinstance(rows, str):  # Worker reports exceptions as "Error: ..."
+                self._append_console(f"Error parsing dump: {rows}")
+                return
+            render(rows, raw)
+
+        self.run_with_callback(lambda: parser(raw), done)
+
+    def _populate_records(self, kind, rows):
+        """Show parsed records with the column layout from _SCHEMAS"""
+        headers, keys = _SCHEMAS[kind]
+        self.current_rows = rows
+        # Built straight into columns; each one is a C-level itemgetter/str pass
+        self.populate_columns(headers, [list(map(str, map(itemgetter(k), rows))) for k in keys])
+
     def _on_sms_text(self, raw):
+        """Parse a raw SMS dump on a worker thread, then render it"""
+        self._parse_in_background(parse_sms_text, raw, self._render_sms_rows)
+
+    def _render_sms_rows(self, rows, raw):
         """Handle SMS data with enhanced error reporting"""
         try:
-            rows = parse_sms_text(raw)
-            
             if not rows:
                 self._append_console("⚠ No SMS data could be parsed. Showing raw output.")
                 raw_lines = raw.splitlines()[:50]
                 self.populate_table(["Raw Output"], [[ln] for ln in raw_lines])
                 return
             
-            self.current_rows = rows
-            table = [[r["address"], r["date"], r["body"]] for r in rows]
-            self.populate_table(["Address", "Date", "Body"], table)
+            self._populate_records("sms", rows)
             self._append_console(f"✓ Successfully parsed {len(rows)} SMS messages")
             
         except Exception as e:
-            self._append_console(f"Error parsing SMS: {e}")
+            self._append_console(f"Error displaying SMS: {e}")
 
     def _on_contacts_text(self, raw):
+        """Parse a raw contacts dump on a worker thread, then render it"""
+        self._parse_in_background(parse_contacts_text, raw, self._render_contacts_rows)
+
+    def _render_contacts_rows(self, rows, raw):
         """Handle contacts data with enhanced error reporting"""
         try:
-            rows = parse_contacts_text(raw)
-            
             if not rows:
                 self._append_console("⚠ No contacts data could be parsed. Showing raw output.")
                 raw_lines = raw.splitlines()[:50]
                 self.populate_table(["Raw Output"], [[ln] for ln in raw_lines])
                 return
             
-            self.current_rows = rows
-            table = [[r["name"], r["number"]] for r in rows]
-            self.populate_table(["Name", "Number"], table)
+            self._populate_records("contacts", rows)
             self._append_console(f"✓ Successfully parsed {len(rows)} contacts")
             
         except Exception as e:
-            self._append_console(f"Error parsing contacts: {e}")
+            self._append_console(f"Error displaying contacts: {e}")
 
     def _on_calls_text(self, raw):
+        """Parse a raw call logs dump on a worker thread, then render it"""
+        self._parse_in_background(parse_calls_text, raw, self._render_calls_rows)
+
+    def _render_calls_rows(self, rows, raw):
         """Handle call log data with enhanced error reporting"""
         try:
-            rows = parse_calls_text(raw)
-            
             if not rows:
                 self._append_console("⚠ No call log data could be parsed. Showing raw output.")
                 raw_lines = raw.splitlines()[:50]
                 self.populate_table(["Raw Output"], [[ln] for ln in raw_lines])
                 return
             
-            self.current_rows = rows
-            table = [[r["name"], r["number"], r["duration_seconds"], r["date"]] for r in rows]
-            self.populate_table(["Name", "Number", "Duration(s)", "Date"], table)
+            self._populate_records("calls", rows)
             self._append_console(f"✓ Successfully parsed {len(rows)} call log entries")
             
         except Exception as e:
-            self._append_console(f"Error parsing call logs: {e}")
+            self._append_console(f"Error displaying call logs: {e}")
 
     # =====================================================================
     #                   TIMELINE FEATURES
@@ -686,6 +862,9 @@ class MobilytixGUI(QWidget):
             return
 
         def fn():
+            from modules.timeline_builder import TimelineBuilder
+            from modules.timeline_visualizer import TimelineVisualizer
+
             builder = TimelineBuilder(session_dir)
             timeline_data, timeline_path = builder.build_timeline()
 
@@ -754,6 +933,19 @@ class MobilytixGUI(QWidget):
         self.populate_table(headers, rows)
         self._append_console(f"Found {len(sessions)} session(s)")
 
+    def _ensure_timeline_view(self):
+        if self.timeline_view is None:
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+            self.timeline_view = QWebEngineView()
+            # Same slot the eager viewer had: right below the markdown output
+            index = self._right_layout.indexOf(self.md_output) + 1
+            self._right_layout.insertWidget(index, self.timeline_view, 1)
+        return self.timeline_view
+
+    def _hide_timeline(self):
+        if self.timeline_view is not None:
+            self.timeline_view.hide()
+
     def display_timeline_html(self, html_path):
         """Render full-featured timeline via WebEngine."""
         try:
@@ -764,8 +956,10 @@ class MobilytixGUI(QWidget):
             self.md_output.hide()
 
             # Load HTML in WebEngine
-            self.timeline_view.show()
-            self.timeline_view.load(QUrl.fromLocalFile(html_path))
+            from PyQt6.QtCore import QUrl
+            view = self._ensure_timeline_view()
+            view.show()
+            view.load(QUrl.fromLocalFile(html_path))
 
             self._append_console("✓ Timeline displayed inside application (WebEngine)")
 
@@ -779,74 +973,67 @@ class MobilytixGUI(QWidget):
     #                   TABLE MANAGEMENT
     # =====================================================================
     def populate_table(self, headers, rows):
-        self.timeline_view.hide()
+        self._populate(lambda: self.model.set_rows(headers, rows))
+
+    def populate_columns(self, headers, columns):
+        """populate_table() for data that is already column-wise (e.g. manifests)"""
+        self._populate(lambda: self.model.set_columns(headers, columns))
+
+    def _populate(self, update):
+        self._show_table()
+        # Hidden with updates off, the view neither repaints nor re-lays out
+        # while the model and row sizes change; it catches up once at show()
+        self.table.setUpdatesEnabled(False)
+        self.table.hide()
+        try:
+            update()
+            self._after_populate()
+        finally:
+            self.table.show()
+            self.table.setUpdatesEnabled(True)
+
+    def _show_table(self):
+        self._hide_timeline()
         self.md_output.hide()  # optional: also hide markdown when table is shown
         self.table.show()      # <-- FIX: ensure table becomes visible again!
-        self.table.clear()
-        self.table.setColumnCount(len(headers))
-        self.table.setRowCount(len(rows))
-        self.table.setHorizontalHeaderLabels(headers)
-
-        for r, row in enumerate(rows):
-            for c, val in enumerate(row):
-                item = QTableWidgetItem(str(val))
-                item.setFlags(item.flags() | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                self.table.setItem(r, c, item)
 
+    def _after_populate(self):
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.resizeRowsToContents()
-
-    def filter_table(self):
-        term = self.search_input.text().lower().strip()
-        if not term or not self.current_rows:
+        # Measuring every row's text is the slow part of a big populate;
+        # past RESIZE_ROWS_MAX rows keep the default height instead
+        if self.model.rowCount() <= RESIZE_ROWS_MAX:
+            self.table.resizeRowsToContents()
+
+    def _live_filter(self):
+        # A single character matches most of a large table; wait for more
+        # (Enter still filters on it explicitly)
+        if len(self.search_input.text().strip()) == 1:
             return
+        self.filter_table()
 
-        keys = set(self.current_rows[0].keys()) if self.current_rows else set()
-        filtered = []
-
-        if "address" in keys:
-            for r in self.current_rows:
-                if term in r.get("address", "").lower() or term in r.get("body", "").lower():
-                    filtered.append([r["address"], r["date"], r["body"]])
-            headers = ["Address", "Date", "Body"]
-
-        elif "duration_seconds" in keys:
-            for r in self.current_rows:
-                if term in r.get("name", "").lower() or term in r.get("number", "").lower():
-                    filtered.append([r["name"], r["number"], r["duration_seconds"], r["date"]])
-            headers = ["Name", "Number", "Duration(s)", "Date"]
-
-        else:
-            for r in self.current_rows:
-                if term in r.get("name", "").lower() or term in r.get("number", "").lower():
-                    filtered.append([r["name"], r["number"]])
-            headers = ["Name", "Number"]
+    def filter_table(self):
+        self._filter_timer.stop()
+        term = fold_text(self.search_input.text().strip())
 
-        self.populate_table(headers, filtered)
-        self._append_console(f"Filter applied: {len(filtered)} results")
+        # Literal, case-insensitive match against every column
+        self.model.set_filter(self.model.match_rows(term) if term else None)
+        self._append_console(f"Filter applied: {self.model.visible_count()} results")
 
     def clear_search(self):
         self.search_input.setText("")
-        if not self.current_rows:
-            return
-
-        keys = set(self.current_rows[0].keys()) if self.current_rows else set()
-        
-        if "address" in keys:
-            rows = [[r["address"], r["date"], r["body"]] for r in self.current_rows]
-            self.populate_table(["Address", "Date", "Body"], rows)
-        elif "duration_seconds" in keys:
-            rows = [[r["name"], r["number"], r["duration_seconds"], r["date"]] for r in self.current_rows]
-            self.populate_table(["Name", "Number", "Duration(s)", "Date"], rows)
-        else:
-            rows = [[r["name"], r["number"]] for r in self.current_rows]
-            self.populate_table(["Name", "Number"], rows)
+        self.model.set_filter(None)
 
     def ui_select_session_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select AI Session Folder")
         if folder:
             self.ai_session_path = folder
             self._append_console(f"✓ AI session folder set: {folder}")
+            # Pay the AI/ReportLab import cost now, off the GUI thread,
+            # instead of as a stall on the first Ask/Report click
+            worker = Worker(lambda: _warm_imports(_AI_MODULES))
+            self.workers.add(worker)
+            worker.finished.connect(lambda _: self.workers.discard(worker))
+            self.pool.start(worker)
         
     def ui_set_api_key(self):
         key, ok = QInputDialog.getText(self, "Groq API Key", "Enter API key:")
@@ -859,7 +1046,7 @@ class MobilytixGUI(QWidget):
             self._append_console("⚠ Set AI session folder first.")
             return
 
-        from modules.ai.ai_indexer import SessionIndexer
+        SessionIndexer = _lazy("modules.ai.ai_indexer").SessionIndexer
 
         def fn():
             indexer = SessionIndexer(self.ai_session_path)
@@ -877,15 +1064,18 @@ class MobilytixGUI(QWidget):
         if not ok or not question:
             return
 
-        from modules.ai.ai_query import AIQueryEngine
+        AIQueryEngine = _lazy("modules.ai.ai_query").AIQueryEngine
 
         def fn():
             engine = AIQueryEngine(self.ai_api_key, self.ai_session_path)
             answer = engine.query(question)
-            return answer
+            return answer, markdown_to_html(answer)
 
-        def cb(answer):
-            self.display_markdown_output(answer)
+        def cb(res):
+            if isinstance(res, str):  # worker error
+                self.display_markdown_output(res)
+                return
+            self.display_markdown_output(*res)
 
         self.run_with_callback(fn, cb)
 
@@ -895,15 +1085,18 @@ class MobilytixGUI(QWidget):
             self._append_console("⚠ Missing AI session path or API key.")
             return
 
-        from modules.ai.ai_reporter import ForensicReporter
+        ForensicReporter = _lazy("modules.ai.ai_reporter").ForensicReporter
 
         def fn():
             reporter = ForensicReporter(self.ai_api_key, self.ai_session_path)
             report = reporter.generate_report()
-            return report
+            return report, markdown_to_html(report)
 
-        def cb(report):
-            self.display_markdown_output(report)
+        def cb(res):
+            if isinstance(res, str):  # worker error
+                self.display_markdown_output(res)
+                return
+            self.display_markdown_output(*res)
 
         self.run_with_callback(fn, cb)
 
@@ -925,154 +1118,18 @@ class MobilytixGUI(QWidget):
         if not path:
             return
 
-        try:
-            self._save_pdf_from_markdown(md_text, path)
-            self._append_console(f"✓ PDF saved to: {path}")
-            QMessageBox.information(self, "Success", "PDF report saved successfully.")
-        except Exception as e:
-            self._append_console(f"PDF Error: {e}")
-            QMessageBox.warning(self, "Error", str(e))
+        # Layout can take seconds on long reports; build on the pool.
+        # Success returns None, failures come back as the Worker's "Error: ..."
+        def cb(err):
+            if err is None:
+                self._append_console(f"✓ PDF saved to: {path}")
+                QMessageBox.information(self, "Success", "PDF report saved successfully.")
+            else:
+                self._append_console(f"PDF {err}")
+                QMessageBox.warning(self, "Error", str(err))
+
+        self.run_with_callback(lambda: self._save_pdf_from_markdown(md_text, path), cb)
 
     def _save_pdf_from_markdown(self, md_text, output_path):
         """Generate a clean, formal forensic-style PDF from markdown text."""
-        from reportlab.platypus import (
-            SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-        )
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.pagesizes import LETTER
-        from reportlab.lib.units import inch
-        from reportlab.lib import colors
-        from datetime import datetime
-
-        # -----------------------------
-        # PDF Document Setup
-        # -----------------------------
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=LETTER,
-            leftMargin=0.8 * inch,
-            rightMargin=0.8 * inch,
-            topMargin=1 * inch,
-            bottomMargin=0.8 * inch
-        )
-
-        styles = getSampleStyleSheet()
-
-        # Base body style
-        body = ParagraphStyle(
-            "Body",
-            parent=styles["Normal"],
-            fontName="Helvetica",
-            fontSize=11,
-            leading=15,
-            textColor=colors.black
-        )
-
-        # Section title style
-        section_title = ParagraphStyle(
-            "SectionTitle",
-            parent=styles["Heading2"],
-            fontName="Helvetica-Bold",
-            fontSize=14,
-            leading=18,
-            spaceAfter=12,
-            textColor=colors.HexColor("#003366")
-        )
-
-        # Metadata style
-        meta_style = ParagraphStyle(
-            "Meta",
-            parent=styles["Normal"],
-            fontName="Helvetica-Oblique",
-            fontSize=9,
-            leading=12,
-            textColor=colors.gray
-        )
-
-        story = []
-
-        # -----------------------------
-        # HEADER BAR
-        # -----------------------------
-        story.append(
-            Paragraph(
-                "<font color='#FFFFFF'><b>Mobilytix Forensic Report</b></font>",
-                ParagraphStyle(
-                    "Header",
-                    fontName="Helvetica-Bold",
-                    fontSize=16,
-                    textColor=colors.white,
-                    backColor=colors.HexColor("#003366"),
-                    leftIndent=0,
-                    alignment=0,
-                    spaceAfter=12,
-                    leading=20,
-                    borderPadding=(6, 6, 6, 6),
-                )
-            )
-        )
-
-        # -----------------------------
-        # METADATA BLOCK
-        # -----------------------------
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        metadata = [
-            ["Generated On:", now],
-            ["Generated By:", "Mobilytix Forensic Engine"],
-            ["Session:", self.ai_session_path or "Unknown"],
-        ]
-
-        table = Table(metadata, colWidths=[1.6 * inch, 4.8 * inch])
-        table.setStyle(
-            TableStyle([
-                ("FONT", (0, 0), (-1, -1), "Helvetica", 9),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#333333")),
-                ("ALIGN", (0, 0), (0, -1), "RIGHT"),
-                ("ALIGN", (1, 0), (1, -1), "LEFT"),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ])
-        )
-        story.append(table)
-        story.append(Spacer(1, 0.25 * inch))
-
-        # -----------------------------
-        # MARKDOWN → TEXT CONVERSION
-        # -----------------------------
-        # Simple markdown cleanup
-        lines = md_text.replace("**", "").split("\n")
-
-        for line in lines:
-            stripped = line.strip()
-
-            if not stripped:
-                story.append(Spacer(1, 0.20 * inch))
-                continue
-
-            # Detect headers
-            if stripped.startswith("# "):
-                story.append(Paragraph(stripped[2:], section_title))
-            elif stripped.startswith("## "):
-                story.append(Paragraph(stripped[3:], section_title))
-            else:
-                story.append(Paragraph(stripped, body))
-
-            story.append(Spacer(1, 0.12 * inch))
-
-        # -----------------------------
-        # FOOTER (drawn on every page)
-        # -----------------------------
-        def footer(canvas, doc):
-            canvas.saveState()
-            canvas.setFont("Helvetica", 9)
-            canvas.setFillColor(colors.gray)
-            canvas.drawRightString(
-                7.5 * inch, 0.55 * inch,
-                f"Mobilytix Forensic Report – Page {doc.page}"
-            )
-            canvas.restoreState()
-
-        # -----------------------------
-        # BUILD FINAL DOCUMENT
-        # -----------------------------
-        doc.build(story, onLaterPages=footer, onFirstPage=footer)
+        save_pdf(md_text, output_path, self.ai_session_path or "Unknown")
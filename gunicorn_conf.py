@@ -0,0 +1,24 @@
+# gunicorn_conf.py
+#
+# Production entrypoint:
+#   gunicorn -c gunicorn_conf.py app:app
+
+import os
+
+bind = os.environ.get("MOBILYTIX_BIND", "127.0.0.1:8080")
+
+# gevent workers patch socket I/O themselves, so each worker can hold many
+# in-flight Groq calls cooperatively: worker_connections, not the process
+# count, is the knob for more concurrent users.
+#
+# Keep a single worker. Each one loads its own embedding model (~1.3 GB),
+# and re-indexing only refreshes the Chroma readers and answer cache of the
+# worker that ran it; other workers would keep answering from a stale view.
+# The chosen session folder and Groq key are also held in worker memory.
+worker_class = "gevent"
+workers = int(os.environ.get("MOBILYTIX_WORKERS", "1"))
+worker_connections = 1000
+
+# LLM answers and report generation can take a while
+timeout = 120
+graceful_timeout = 30
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 import sys
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 from gui import MobilytixGUI
 
 def main():
     # Start the PyQt GUI only
+    # QtWebEngine is imported lazily (first timeline view), which Qt only
+    # allows when context sharing is enabled before the QApplication exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     qt_app = QApplication(sys.argv)
     gui = MobilytixGUI()
     gui.show()
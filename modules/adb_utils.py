@@ -4,7 +4,18 @@ import subprocess
 import datetime
 import hashlib
 import json
+import mmap
+import queue
+import shlex
+import shutil
 import struct
+import threading
+import time
+import uuid
+import warnings
+import atexit
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # -----------------------------
@@ -16,6 +27,22 @@ def timestamp(fmt="%Y-%m-%d %H:%M:%S"):
 def fname_timestamp():
     return datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
+def _ttl_cache(seconds):
+    """Memoize a no-argument function's result for `seconds` (.cache_clear() drops it)"""
+    def wrap(fn):
+        state = {}
+
+        @functools.wraps(fn)
+        def cached():
+            now = time.monotonic()
+            if "value" not in state or now - state["at"] >= seconds:
+                state["value"], state["at"] = fn(), now
+            return state["value"]
+
+        cached.cache_clear = state.clear
+        return cached
+    return wrap
+
 def epoch_ms_to_str(ms):
     try:
         ms = int(ms)
@@ -30,12 +57,141 @@ def epoch_ms_to_str(ms):
 # -----------------------------
 # ADB wrapper with better error handling
 # -----------------------------
+def _decode(data):
+    """Try UTF-8 first, fallback to latin-1 if needed"""
+    try:
+        return data.decode('utf-8').strip()
+    except UnicodeDecodeError:
+        return data.decode('latin-1', errors='replace').strip()
+
+def _pump(stream, q):
+    """Reader thread: forward lines from a pipe into a queue, None at EOF"""
+    for line in iter(stream.readline, b""):
+        q.put(line)
+    q.put(None)
+
+class AdbShell:
+    """
+    One long-lived `adb shell` process that runs shell commands in turn, so
+    a command costs a pipe round trip instead of spawning adb (100-300ms on
+    Windows; brute_scan_fs issues one or two per directory entry).
+
+    Each command runs as `sh -c <quoted> </dev/null` (same semantics as a
+    one-shot `adb shell ...`; a malformed command can't leave the shell
+    waiting for input, and one that reads stdin can't swallow the lines
+    after it), followed by end markers on stdout and stderr. Older adb
+    without the shell protocol merges stderr into stdout; that is detected
+    once per process and the stderr marker skipped.
+
+    run() returns None when another thread is using the shell, or the
+    shell can't start or exits mid command (e.g. device unplugged);
+    run_adb() then falls back to a one-shot `adb shell`.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+        self._marker = f"__MOBILYTIX_{uuid.uuid4().hex}_"
+        self._merged = False
+        # Bumped on every (re)start; a new device connection means a new shell
+        self.generation = 0
+
+    def _read_until(self, q, tag, deadline):
+        """Lines from q up to the `tag` marker; also reports if the stderr marker was seen"""
+        end = (self._marker + tag).encode()
+        err_end = (self._marker + "E").encode()
+        lines, saw_err = [], False
+        while True:
+            try:
+                line = q.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                raise subprocess.TimeoutExpired("adb shell", 0)
+            if line is None:
+                raise EOFError("adb shell exited")
+            if line.startswith(end):
+                return b"".join(lines), saw_err
+            if line.startswith(err_end):
+                saw_err = True
+                continue
+            lines.append(line)
+
+    def _start(self, timeout=10):
+        self._proc = subprocess.Popen(
+            ["adb", "shell"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            bufsize=0
+        )
+        self.generation += 1
+        self._out, self._err = queue.Queue(), queue.Queue()
+        for stream, q in ((self._proc.stdout, self._out), (self._proc.stderr, self._err)):
+            threading.Thread(target=_pump, args=(stream, q), daemon=True).start()
+
+        # Probe which stream stderr lands on
+        m = self._marker
+        self._proc.stdin.write(f"echo {m}E >&2; echo {m}O\n".encode())
+        deadline = time.monotonic() + timeout
+        _, self._merged = self._read_until(self._out, "O", deadline)
+        if not self._merged:
+            self._read_until(self._err, "E", deadline)
+
+    def live_generation(self):
+        """generation of the running shell, or None if there isn't one"""
+        if self._proc is not None and self._proc.poll() is None:
+            return self.generation
+        return None
+
+    def close(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except OSError:
+                pass
+            self._proc = None
+
+    def run(self, cmd, timeout=60):
+        """(stdout, stderr) bytes for one shell command, or None (see class doc)"""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            m = self._marker
+            line = f"sh -c {shlex.quote(cmd)} </dev/null; echo; echo {m}O"
+            if not self._merged:
+                line += f"; echo >&2; echo {m}E >&2"
+            self._proc.stdin.write((line + "\n").encode())
+
+            deadline = time.monotonic() + timeout
+            out, _ = self._read_until(self._out, "O", deadline)
+            err = b"" if self._merged else self._read_until(self._err, "E", deadline)[0]
+            return out, err
+        except subprocess.TimeoutExpired:
+            # Output of the stuck command would bleed into the next one
+            self.close()
+            raise
+        except (OSError, EOFError):
+            self.close()
+            return None
+        finally:
+            self._lock.release()
+
+_shell = AdbShell()
+atexit.register(_shell.close)
+
 def run_adb(args, timeout=60):
     """
     Executes adb command and returns stdout if present otherwise stderr.
     Handles Unicode properly on Windows.
+    Shell commands go through the persistent AdbShell when it is free;
+    other verbs (pull, devices, ...) spawn adb as before.
     """
     try:
+        if len(args) > 1 and args[0] == "shell":
+            res = _shell.run(" ".join(args[1:]), timeout)
+            if res is not None:
+                out, err = (_decode(b) for b in res)
+                return out if out else err
+
         # Use bytes mode and decode manually for better control
         proc = subprocess.run(
             ["adb"] + args, 
@@ -43,16 +199,8 @@ def run_adb(args, timeout=60):
             timeout=timeout
         )
         
-        # Try UTF-8 first, fallback to latin-1 if needed
-        try:
-            out = proc.stdout.decode('utf-8').strip()
-        except UnicodeDecodeError:
-            out = proc.stdout.decode('latin-1', errors='replace').strip()
-        
-        try:
-            err = proc.stderr.decode('utf-8').strip()
-        except UnicodeDecodeError:
-            err = proc.stderr.decode('latin-1', errors='replace').strip()
+        out = _decode(proc.stdout)
+        err = _decode(proc.stderr)
         
         return out if out else err
         
@@ -84,12 +232,62 @@ def grant_adb_permissions():
 # -----------------------------
 # Device detection
 # -----------------------------
-def detect_device_manufacturer():
-    """Detect device manufacturer and model for device-specific handling"""
-    mfg = run_adb(["shell", "getprop", "ro.product.manufacturer"]).lower()
-    model = run_adb(["shell", "getprop", "ro.product.model"]).lower()
-    brand = run_adb(["shell", "getprop", "ro.product.brand"]).lower()
-    sdk = run_adb(["shell", "getprop", "ro.build.version.sdk"])
+# `getprop` with no arguments prints every property as "[key]: [value]"
+_PROP_LINE_RE = re.compile(r'^\[(.+?)\]:\s*\[(.*)\]\s*$', re.MULTILINE)
+
+def get_all_props():
+    """Dump all system properties with a single adb round trip ({} on failure)"""
+    return dict(_PROP_LINE_RE.findall(run_adb(["shell", "getprop"])))
+
+# Separates values in getprops() output
+_PROP_MARK = "__MOBILYTIX_PROP__"
+
+def getprops(keys):
+    """Several properties in one adb round trip, as {key: value}"""
+    cmd = "; ".join(f"echo {_PROP_MARK}{k}; getprop {k}" for k in keys)
+    out = run_adb(["shell", cmd])
+    if _PROP_MARK not in out:
+        # adb failed: report its message for every key, as per-key calls did
+        return {k: out for k in keys}
+    props = {}
+    for chunk in out.split(_PROP_MARK)[1:]:
+        key, _, value = chunk.partition("\n")
+        props[key.strip()] = value.strip()
+    return props
+
+_MANUFACTURER_PROPS = (
+    "ro.product.manufacturer", "ro.product.model", "ro.product.brand", "ro.build.version.sdk",
+)
+
+def detect_device_manufacturer(props=None):
+    """
+    Detect device manufacturer and model for device-specific handling.
+    `props` is a get_all_props()/getprops() dict; without one the needed
+    properties are fetched in a single batch.
+
+    Fetched results are memoized per persistent shell session: these
+    properties can't change while the device stays connected, and a
+    re-plugged device gets a new shell. detect_device_manufacturer.cache_clear()
+    drops them explicitly.
+    """
+    if props:
+        return _manufacturer_info(props)
+    session = _shell.live_generation()
+    if session is None:
+        return _manufacturer_info(getprops(_MANUFACTURER_PROPS))
+    return dict(_session_manufacturer(session))
+
+@functools.lru_cache(maxsize=8)
+def _session_manufacturer(session):
+    return _manufacturer_info(getprops(_MANUFACTURER_PROPS))
+
+detect_device_manufacturer.cache_clear = _session_manufacturer.cache_clear
+
+def _manufacturer_info(props):
+    mfg = props.get("ro.product.manufacturer", "").lower()
+    model = props.get("ro.product.model", "").lower()
+    brand = props.get("ro.product.brand", "").lower()
+    sdk = props.get("ro.build.version.sdk", "")
     
     try:
         sdk_int = int(sdk)
@@ -112,11 +310,24 @@ def detect_device_manufacturer():
 # -----------------------------
 # Enhanced content provider queries with fallbacks
 # -----------------------------
+# Any of these in a query's output means the attempt failed
+_QUERY_ERR_RE = re.compile(
+    r"error|exception|denied|failed|unknown|no such|unable|cannot|not found",
+    re.IGNORECASE
+)
+# Failures that only rule out the projection tried...
+_COLUMN_ERR_RE = re.compile(r"no such column|unknown column|invalid column", re.IGNORECASE)
+# ...and ones that will repeat for every projection of the URI
+_URI_ERR_RE = re.compile(r"denied|denial|no such|not found|unknown ur[il]|could not find provider", re.IGNORECASE)
+
 def query_content_provider_with_fallbacks(uri_variants, projection_variants, label="data"):
     """
     Try multiple URI and projection combinations until one works.
     Returns (success_flag, raw_output, uri_used, projection_used)
+    A URI-level error (permission, missing provider) skips the URI's
+    remaining projections; on failure the output lists the skipped URIs.
     """
+    skipped = []
     for uri in uri_variants:
         for projection in projection_variants:
             if projection:
@@ -125,13 +336,15 @@ def query_content_provider_with_fallbacks(uri_variants, projection_variants, lab
                 result = run_adb(["shell", "content", "query", "--uri", uri])
             
             # Check if result indicates success
-            if result and not any(err in result.lower() for err in [
-                "error", "exception", "denied", "failed", "unknown", 
-                "no such", "unable", "cannot", "not found"
-            ]):
+            if result and not _QUERY_ERR_RE.search(result):
                 return True, result, uri, projection
+
+            uri_err = result and not _COLUMN_ERR_RE.search(result) and _URI_ERR_RE.search(result)
+            if uri_err:
+                skipped.append(f"\n# Skipped {uri}: {uri_err.group(0).lower()}")
+                break
     
-    return False, f"All {label} query attempts failed.", None, None
+    return False, f"All {label} query attempts failed." + "".join(skipped), None, None
 
 def dump_sms_enhanced(dest):
     """Enhanced SMS dump with multiple fallback strategies"""
@@ -362,6 +575,7 @@ def dump_calls(dest):
 # -----------------------------
 # Basic device helpers
 # -----------------------------
+@_ttl_cache(2)
 def list_devices():
     return run_adb(["devices", "-l"])
 
@@ -371,8 +585,8 @@ def list_apps():
 def list_files():
     return run_adb(["shell", "ls", "-a", "/sdcard/"])
 
-def get_device_info():
-    props = [
+def get_device_info(props=None):
+    fields = [
         ("Model", "ro.product.model"),
         ("Manufacturer", "ro.product.manufacturer"),
         ("Brand", "ro.product.brand"),
@@ -382,9 +596,11 @@ def get_device_info():
         ("Build Date", "ro.build.date"),
         ("SDK", "ro.build.version.sdk"),
     ]
+    if not props:
+        props = getprops([prop for _, prop in fields])
     lines = []
-    for label, prop in props:
-        val = run_adb(["shell", "getprop", prop])
+    for label, prop in fields:
+        val = props.get(prop, "")
         lines.append(f"{label}: {val}")
     return "\n".join(lines)
 
@@ -534,57 +750,151 @@ def brute_scan_fs(root="/sdcard"):
 
     return discovered
 
+# One line per entry: type, size, mtime, path (toybox find, Android 7+)
+_FIND_FORMAT = r"%y\t%s\t%T@\t%p\n"
+
+def fast_scan_fs(root="/sdcard"):
+    """
+    Single-command scanner: one `find` instead of an ls/[ -d ] round-trip
+    per entry. Returns the same dicts as brute_scan_fs plus device-side
+    "size" and "mtime", and falls back to brute_scan_fs when the device's
+    find can't -printf. Hidden entries are skipped, as `ls -1` does.
+    """
+    root = root.rstrip("/") or "/"
+    # -H: /sdcard itself is a symlink to the real storage mount
+    out = run_adb(["shell", f"find -H {shlex.quote(root)} -name '.*' -prune -o -printf '{_FIND_FORMAT}'"])
+
+    discovered = []
+    parsed = False
+    for line in out.splitlines():
+        parts = line.split("\t", 3)
+        if len(parts) != 4 or len(parts[0]) != 1:
+            continue
+        kind, size, mtime, path = parts
+        try:
+            size, mtime = int(size), float(mtime)
+        except ValueError:
+            continue
+        parsed = True
+        if path == root:
+            continue
+        discovered.append({"path": path, "is_dir": kind == "d", "size": size, "mtime": mtime})
+
+    # Not even the root came back: find is missing or lacks -printf
+    if not parsed:
+        return brute_scan_fs(root)
+    return discovered
+
+# -----------------------------
+# Concurrent pulls
+# -----------------------------
+# Pulls in flight at once, across all callers. The adb server runs several
+# transfers per device; lower it for slow (USB 2.0) links.
+ADB_CONCURRENCY = max(1, int(os.environ.get("MOBILYTIX_ADB_CONCURRENCY", "8")))
+_pull_slots = threading.BoundedSemaphore(ADB_CONCURRENCY)
+
+def _pull_one(hash_pool, remote, local, scanned=None):
+    """
+    Pull one file and return its manifest entry. Size and mtime come from
+    `scanned` (a fast_scan_fs entry) when it has them, else from the copy.
+    Hashing is handed to `hash_pool`, so "hashes" is a Future (or None if
+    the pull failed) for _pull_many to resolve.
+    """
+    os.makedirs(os.path.dirname(local), exist_ok=True)
+    with _pull_slots:
+        adb_res = run_adb(["pull", remote, local], timeout=240)
+
+    # One stat answers "was it pulled?" and gives size and mtime
+    try:
+        st = os.stat(local)
+    except OSError:
+        size, mtime, hashes = 0, 0, None
+    else:
+        if scanned and "size" in scanned:
+            size, mtime = scanned["size"], scanned["mtime"]
+        else:
+            size, mtime = st.st_size, st.st_mtime
+        hashes = hash_pool.submit(compute_hashes, local)
+
+    return {
+        "remote_path": remote,
+        "local_path": local,
+        "size": size,
+        "mtime": mtime,
+        "hashes": hashes,
+        "adb_result": adb_res
+    }
+
+def _pull_many(jobs):
+    """Run _pull_one over (remote, local, scanned) jobs concurrently; entries keep job order."""
+    if not jobs:
+        return []
+    # Pulls wait on the adb link and hashing on the CPU (hashlib drops the
+    # GIL): separate pools let a file hash while the next ones transfer
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as hash_pool, \
+            ThreadPoolExecutor(max_workers=min(ADB_CONCURRENCY, len(jobs))) as pull_pool:
+        manifest = list(pull_pool.map(lambda job: _pull_one(hash_pool, *job), jobs))
+
+    for entry in manifest:
+        pending = entry["hashes"]
+        entry["hashes"] = pending.result() if pending else {"md5": None, "sha1": None, "sha256": None}
+    return manifest
+
 # -----------------------------
 # Pull using brute scan
 # -----------------------------
 def brute_extract_folder(remote_root, dest_root):
     """
-    Use brute_scan_fs to discover files and pull them.
+    Use fast_scan_fs to discover files and pull them.
     Returns manifest list.
     """
     remote_root = remote_root.rstrip("/")
     dest_root = os.path.abspath(dest_root)
     os.makedirs(dest_root, exist_ok=True)
 
-    fs_items = brute_scan_fs(remote_root)
-    manifest = []
-
-    for entry in fs_items:
-        if entry.get("is_dir"):
-            continue
-        remote = entry.get("path")
-        local = os.path.join(dest_root, remote.lstrip("/"))
-        os.makedirs(os.path.dirname(local), exist_ok=True)
-        adb_out = run_adb(["pull", remote, local], timeout=240)
-
-        size = os.path.getsize(local) if os.path.exists(local) else 0
-        mtime = os.path.getmtime(local) if os.path.exists(local) else 0
-        hashes = compute_hashes(local) if os.path.exists(local) else {"md5": None, "sha1": None, "sha256": None}
-
-        manifest.append({
-            "remote_path": remote,
-            "local_path": local,
-            "size": size,
-            "mtime": mtime,
-            "hashes": hashes,
-            "adb_result": adb_out
-        })
-
-    return manifest
+    fs_items = fast_scan_fs(remote_root)
+    jobs = [
+        (entry["path"], os.path.join(dest_root, entry["path"].lstrip("/")), entry)
+        for entry in fs_items if not entry.get("is_dir")
+    ]
+    return _pull_many(jobs)
 
 # -----------------------------
 # Hashing
 # -----------------------------
-def compute_hashes(path, chunk_size=4*1024*1024):
+# Files smaller than this are hashed straight from an mmap; larger ones
+# are streamed so the mapping never spans most of the address space
+MMAP_HASH_MAX = 1 << 30
+
+# Streaming read size: big enough that each update() runs long inside
+# OpenSSL's SHA-NI / ARMv8-crypto code rather than in Python
+HASH_CHUNK = 16 * 1024 * 1024
+
+# OpenSSL-backed digests live in _hashlib; the builtin fallbacks (Python
+# built without OpenSSL) are scalar code several times slower
+if type(hashlib.sha256()).__module__ != "_hashlib":
+    warnings.warn("hashlib is not using OpenSSL; evidence hashing will be slow", RuntimeWarning)
+
+def compute_hashes(path, chunk_size=HASH_CHUNK):
     try:
         md5 = hashlib.md5()
         sha1 = hashlib.sha1()
         sha256 = hashlib.sha256()
+        digests = (md5, sha1, sha256)
         with open(path, "rb") as f:
-            while chunk := f.read(chunk_size):
-                md5.update(chunk)
-                sha1.update(chunk)
-                sha256.update(chunk)
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size < MMAP_HASH_MAX:
+                # One C-level update per digest, no per-chunk Python work
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for d in digests:
+                        d.update(mm)
+            else:
+                # Reuse one buffer instead of allocating a bytes per chunk
+                buf = bytearray(chunk_size)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    for d in digests:
+                        d.update(view[:n])
         return {"md5": md5.hexdigest(), "sha1": sha1.hexdigest(), "sha256": sha256.hexdigest()}
     except Exception:
         return {"md5": None, "sha1": None, "sha256": None}
@@ -604,73 +914,97 @@ def pull_folder_with_metadata(remote_folder, local_root):
     if not ls_output or "No such" in ls_output or "denied" in ls_output.lower():
         return "No files found or permission denied."
 
-    manifest = []
+    jobs = []
     for item in ls_output.splitlines():
         item = item.strip()
         if not item:
             continue
         remote = f"{remote_folder.rstrip('/')}/{item}"
-        local_path = os.path.join(local_root, remote.lstrip("/"))
-        os.makedirs(os.path.dirname(local_path), exist_ok=True)
-
-        adb_res = run_adb(["pull", remote, local_path], timeout=240)
-        size = os.path.getsize(local_path) if os.path.exists(local_path) else 0
-        mtime = os.path.getmtime(local_path) if os.path.exists(local_path) else 0
-        hashes = compute_hashes(local_path) if os.path.exists(local_path) else {"md5": None, "sha1": None, "sha256": None}
-
-        manifest.append({
-            "remote_path": remote,
-            "local_path": local_path,
-            "size": size,
-            "mtime": mtime,
-            "hashes": hashes,
-            "adb_result": adb_res
-        })
-    return manifest
+        jobs.append((remote, os.path.join(local_root, remote.lstrip("/")), None))
+    return _pull_many(jobs)
 
 # -----------------------------
 # ADB backup
 # -----------------------------
 def perform_adb_backup(dest):
     ab_path = os.path.join(dest, "full_backup.ab")
-    cmd = f'adb backup -all -f "{ab_path}"'
-    os.system(cmd)
+    try:
+        # Blocks until the backup is confirmed (or refused) on the device
+        subprocess.run(["adb", "backup", "-all", "-f", ab_path], check=False, timeout=3600)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
     if not os.path.exists(ab_path) or os.path.getsize(ab_path) == 0:
         return None
+    tar_path = ab_path.replace(".ab", ".tar")
     try:
         import zlib
-        with open(ab_path, "rb") as f:
-            f.read(24)
-            data = f.read()
-        decompressed = zlib.decompress(data)
-        tar_path = ab_path.replace(".ab", ".tar")
-        with open(tar_path, "wb") as out:
-            out.write(decompressed)
+        # Inflate chunk by chunk straight into the tar: memory stays flat
+        # however large the backup is
+        dec = zlib.decompressobj()
+        with open(ab_path, "rb") as fin, open(tar_path, "wb") as fout:
+            fin.read(24)
+            while chunk := fin.read(1 << 20):
+                fout.write(dec.decompress(chunk))
+            fout.write(dec.flush())
+        if not dec.eof:
+            raise zlib.error("truncated backup stream")
         return tar_path
     except Exception:
+        # Encrypted or damaged backup: keep the raw .ab only
+        if os.path.exists(tar_path):
+            os.remove(tar_path)
         return ab_path
 
 # -----------------------------
 # Local scan to manifest
 # -----------------------------
-def scan_local_tree_for_manifest(local_root):
+def _walk_files(top):
+    """
+    Yield (path, stat_result) for every file under `top`, in os.walk order
+    (a directory's files before its subdirectories). DirEntry caches the
+    stat, so nothing is stat'ed twice; unreadable directories are skipped
+    and directory symlinks are not followed, as os.walk does.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            st = entry.stat()
+        except OSError:
+            continue
+        yield entry.path, st
+    for path in subdirs:
+        yield from _walk_files(path)
+
+def scan_local_tree_for_manifest(local_root, known=None):
+    """
+    Manifest entries for every file under local_root, skipping paths in
+    `known` (absolute paths already in the caller's manifest).
+    """
+    known = known or set()
     manifest = []
-    for root, dirs, files in os.walk(local_root):
-        for file in files:
-            local_path = os.path.join(root, file)
-            rel = os.path.relpath(local_path, local_root)
-            remote_sim = "/" + rel.replace("\\", "/")
-            size = os.path.getsize(local_path)
-            mtime = os.path.getmtime(local_path)
-            hashes = compute_hashes(local_path)
-            manifest.append({
-                "remote_path": remote_sim,
-                "local_path": local_path,
-                "size": size,
-                "mtime": mtime,
-                "hashes": hashes,
-                "adb_result": "local-scan"
-            })
+    for local_path, st in _walk_files(local_root):
+        if os.path.abspath(local_path) in known:
+            continue
+        rel = os.path.relpath(local_path, local_root)
+        remote_sim = "/" + rel.replace("\\", "/")
+        hashes = compute_hashes(local_path)
+        manifest.append({
+            "remote_path": remote_sim,
+            "local_path": local_path,
+            "size": st.st_size,
+            "mtime": st.st_mtime,
+            "hashes": hashes,
+            "adb_result": "local-scan"
+        })
     return manifest
 
 # -----------------------------
@@ -687,38 +1021,45 @@ PUBLIC_FOLDERS = [
     "/sdcard/Android/media"
 ]
 
+# Concurrent adb operations during a full extraction (the adb server
+# multiplexes transfers; more mostly contends for USB bandwidth)
+EXTRACTION_WORKERS = 4
+
+def _provider_dump(dest, name, query):
+    """Write a live content-provider dump into dest and return its manifest entry"""
+    path = os.path.join(dest, f"{name}_{fname_timestamp()}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(query())
+    return {"remote_path": f"{name}-dump", "local_path": path, "size": os.path.getsize(path), "mtime": os.path.getmtime(path), "hashes": compute_hashes(path), "adb_result": "content-provider"}
+
 def perform_full_extraction(dest):
     dest = os.path.abspath(dest)
     os.makedirs(dest, exist_ok=True)
     manifest = []
 
-    for folder in PUBLIC_FOLDERS:
-        try:
-            entries = pull_folder_with_metadata(folder, dest)
-            if isinstance(entries, list):
-                manifest.extend(entries)
-        except Exception:
-            pass
+    # Folder pulls and provider dumps are independent: run them together,
+    # then collect in the original order (folders, sms, contacts, calls)
+    with ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS) as ex:
+        folder_jobs = [ex.submit(pull_folder_with_metadata, folder, dest) for folder in PUBLIC_FOLDERS]
+        dump_jobs = [
+            ex.submit(_provider_dump, dest, name, query)
+            for name, query in (("sms", query_sms_live), ("contacts", query_contacts_live), ("calls", query_calls_live))
+        ]
 
-    try:
-        sms_file = os.path.join(dest, f"sms_{fname_timestamp()}.txt")
-        open(sms_file, "w", encoding="utf-8").write(query_sms_live())
-        manifest.append({"remote_path": "sms-dump", "local_path": sms_file, "size": os.path.getsize(sms_file), "mtime": os.path.getmtime(sms_file), "hashes": compute_hashes(sms_file), "adb_result": "content-provider"})
-    except Exception:
-        pass
-    try:
-        contacts_file = os.path.join(dest, f"contacts_{fname_timestamp()}.txt")
-        open(contacts_file, "w", encoding="utf-8").write(query_contacts_live())
-        manifest.append({"remote_path": "contacts-dump", "local_path": contacts_file, "size": os.path.getsize(contacts_file), "mtime": os.path.getmtime(contacts_file), "hashes": compute_hashes(contacts_file), "adb_result": "content-provider"})
-    except Exception:
-        pass
-    try:
-        calls_file = os.path.join(dest, f"calls_{fname_timestamp()}.txt")
-        open(calls_file, "w", encoding="utf-8").write(query_calls_live())
-        manifest.append({"remote_path": "calls-dump", "local_path": calls_file, "size": os.path.getsize(calls_file), "mtime": os.path.getmtime(calls_file), "hashes": compute_hashes(calls_file), "adb_result": "content-provider"})
-    except Exception:
-        pass
+        for job in folder_jobs:
+            try:
+                entries = job.result()
+                if isinstance(entries, list):
+                    manifest.extend(entries)
+            except Exception:
+                pass
+        for job in dump_jobs:
+            try:
+                manifest.append(job.result())
+            except Exception:
+                pass
 
+    # adb backup waits for confirmation on the device, so it runs on its own
     try:
         backup = perform_adb_backup(dest)
         if backup:
@@ -733,8 +1074,11 @@ def perform_full_extraction(dest):
     except Exception:
         pass
 
+    # Pick up only what the steps above didn't record (e.g. files inside
+    # pulled directories) instead of re-hashing the whole extraction
     try:
-        manifest.extend(scan_local_tree_for_manifest(dest))
+        known = {os.path.abspath(e["local_path"]) for e in manifest if e.get("local_path")}
+        manifest.extend(scan_local_tree_for_manifest(dest, known))
     except Exception:
         pass
 
@@ -745,19 +1089,85 @@ def perform_full_extraction(dest):
 # -----------------------------
 MAGIC = b"MOBIN001"
 
+def _append_file(out, src):
+    """Append open file `src` to `out`: in-kernel sendfile where the OS allows it, else copyfileobj."""
+    sent = 0
+    if hasattr(os, "sendfile"):
+        size = os.fstat(src.fileno()).st_size
+        out.flush()
+        try:
+            while sent < size:
+                n = os.sendfile(out.fileno(), src.fileno(), sent, size - sent)
+                if n == 0:
+                    break
+                sent += n
+        except OSError:
+            # e.g. macOS, where the destination must be a socket
+            pass
+        # Resync the buffered writer with the fd offset sendfile advanced
+        out.seek(os.lseek(out.fileno(), 0, os.SEEK_CUR))
+    src.seek(sent)
+    shutil.copyfileobj(src, out, length=4*1024*1024)
+
+def _prefetch(path):
+    """Ask the kernel to start reading `path` into the page cache (POSIX only, best effort)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _write_manifest_json(out, manifest):
+    """
+    Write {"generated": ..., "entries": [...]} to `out` one entry at a time
+    (each through the C encoder) rather than as one big string. Returns
+    the number of bytes written.
+    """
+    written = out.write(f'{{"generated": {json.dumps(timestamp())}, "entries": ['.encode("utf-8"))
+    for i, entry in enumerate(manifest):
+        chunk = json.dumps(entry)
+        written += out.write(((", " if i else "") + chunk).encode("utf-8"))
+    written += out.write(b"]}")
+    return written
+
 def archive_to_bin(manifest, output_bin):
-    manifest_json = json.dumps({"generated": timestamp(), "entries": manifest}, indent=2).encode("utf-8")
+    # Accepts a manifest list or any sequence of entries (e.g. ManifestStore)
+    manifest = list(manifest)
+    members = [entry.get("local_path") for entry in manifest]
+    members = [loc for loc in members if loc and os.path.exists(loc)]
     try:
         with open(output_bin, "wb") as out:
             out.write(MAGIC)
-            out.write(struct.pack("<Q", len(manifest_json)))
-            out.write(manifest_json)
-            for entry in manifest:
-                loc = entry.get("local_path")
-                if loc and os.path.exists(loc):
-                    with open(loc, "rb") as f:
-                        while chunk := f.read(4*1024*1024):
-                            out.write(chunk)
+            # Length placeholder, patched once the manifest is streamed out
+            out.write(struct.pack("<Q", 0))
+            json_len = _write_manifest_json(out, manifest)
+            out.seek(len(MAGIC))
+            out.write(struct.pack("<Q", json_len))
+            out.seek(0, os.SEEK_END)
+
+            # Reserve the member data up front so the filesystem can lay
+            # it out contiguously; trimmed to what was written at the end
+            data_size = sum(map(os.path.getsize, members))
+            if data_size and hasattr(os, "posix_fallocate"):
+                out.flush()
+                try:
+                    os.posix_fallocate(out.fileno(), out.tell(), data_size)
+                except OSError:
+                    pass
+            for i, loc in enumerate(members):
+                # Overlap the next member's disk reads with this copy
+                if i + 1 < len(members):
+                    _prefetch(members[i + 1])
+                with open(loc, "rb") as f:
+                    _append_file(out, f)
+            out.truncate()
         return f"BIN created -> {output_bin}"
     except Exception as e:
         return f"BIN creation failed: {e}"
\ No newline at end of file
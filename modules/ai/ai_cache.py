@@ -0,0 +1,82 @@
+# modules/ai/ai_cache.py
+
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+
+from modules.ai.ai_embedding import embed_text
+
+
+class SemanticCache:
+    """
+    Per-session cache of AI answers keyed by question embeddings.
+
+    A question whose embedding is close enough to one already answered for
+    the same session reuses the stored answer instead of calling the LLM.
+    """
+
+    # bge-large similarities cluster high, so keep the cutoff tight enough
+    # that only genuine paraphrases hit ("who called most" != "who texted most")
+    MAX_DISTANCE = 0.05
+    TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(self, session_path: str | Path):
+        self.db_path = Path(session_path) / "answer_cache.sqlite"
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                " id INTEGER PRIMARY KEY,"
+                " question TEXT NOT NULL,"
+                " embedding BLOB NOT NULL,"
+                " answer TEXT NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def lookup(self, question: str):
+        """
+        Return (cached_answer, question_embedding).
+
+        cached_answer is None on a miss; the embedding is handed back so the
+        caller can store() the fresh answer without embedding twice.
+        """
+        emb = np.asarray(embed_text(question), dtype=np.float32)
+        cutoff = time.time() - self.TTL_SECONDS
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT embedding, answer FROM answers WHERE created >= ?",
+                (cutoff,),
+            ).fetchall()
+        if not rows:
+            return None, emb
+
+        matrix = np.frombuffer(b"".join(r[0] for r in rows), dtype=np.float32)
+        matrix = matrix.reshape(len(rows), -1)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(emb)
+        sims = (matrix @ emb) / np.maximum(norms, 1e-12)
+
+        best = int(np.argmax(sims))
+        if 1.0 - float(sims[best]) <= self.MAX_DISTANCE:
+            return rows[best][1], emb
+        return None, emb
+
+    def store(self, question: str, embedding, answer: str):
+        now = time.time()
+        blob = np.asarray(embedding, dtype=np.float32).tobytes()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM answers WHERE created < ?", (now - self.TTL_SECONDS,))
+            conn.execute(
+                "INSERT INTO answers (question, embedding, answer, created) VALUES (?, ?, ?, ?)",
+                (question, blob, answer, now),
+            )
+
+    def clear(self):
+        """Drop all cached answers (e.g. after the session is re-indexed)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM answers")
@@ -1,21 +1,58 @@
 # modules/ai/ai_embedding.py
 
-from sentence_transformers import SentenceTransformer
+import os
 import threading
 
-class EmbeddingModel:
-    _instance = None
-    _lock = threading.Lock()
+# sentence_transformers (and torch behind it) is imported on first use:
+# it costs seconds at startup and most sessions never embed anything
 
-    @staticmethod
-    def get():
-        """Singleton loader for embedding model."""
-        if EmbeddingModel._instance is None:
-            with EmbeddingModel._lock:
-                if EmbeddingModel._instance is None:
-                    EmbeddingModel._instance = SentenceTransformer("BAAI/bge-large-en-v1.5")
-        return EmbeddingModel._instance
+_MODEL = None
+_lock = threading.Lock()
+
+def _load_model():
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    # Leave cores for the GUI and adb workers during CPU inference
+    torch.set_num_threads(min(4, os.cpu_count() or 1))
+    if torch.cuda.is_available():
+        device = "cuda"
+    elif torch.backends.mps.is_available():
+        device = "mps"
+    else:
+        device = "cpu"
+    model = SentenceTransformer("BAAI/bge-large-en-v1.5", device=device)
+    # fp16 halves memory traffic on GPUs; CPUs lack fast fp16 kernels
+    if device != "cpu":
+        model = model.half()
+    return model
+
+def get_model():
+    """Singleton loader for embedding model."""
+    global _MODEL
+    # Once loaded this is one global read; the lock only guards the load
+    model = _MODEL
+    if model is not None:
+        return model
+    with _lock:
+        if _MODEL is None:
+            _MODEL = _load_model()
+        return _MODEL
+
+def embed_texts(texts, batch_size: int = 64):
+    """
+    Embed many texts in batched forward passes. Returns a float32 numpy
+    array with one unit-length row per text (cosine-ready).
+    """
+    model = get_model()
+    vectors = model.encode(
+        list(texts),
+        batch_size=batch_size,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
+    return vectors.astype("float32", copy=False)
 
 def embed_text(text: str):
-    model = EmbeddingModel.get()
-    return model.encode(text).tolist()
+    return embed_texts([text])[0].tolist()
@@ -1,29 +1,63 @@
 # modules/ai/ai_formatter.py
 
+import io
 import re
+import sys
+import time
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache, wraps
+
+# Call, SMS and contact logs repeat the same numbers and dates across
+# thousands of rows; the helpers below remember their recent inputs
+_HELPER_CACHE_SIZE = 65536
+
+
+def _cached(fn):
+    """lru_cache for a one-argument helper; unhashable args bypass it."""
+    # typed: 1 and 1.0 are equal keys but format differently
+    cached = lru_cache(maxsize=_HELPER_CACHE_SIZE, typed=True)(fn)
+
+    @wraps(fn)
+    def lookup(arg):
+        try:
+            return cached(arg)
+        except TypeError:
+            return fn(arg)
+
+    lookup.cache_clear = cached.cache_clear
+    lookup.cache_info = cached.cache_info
+    return lookup
 
 # ============================
 # PHONE NORMALIZATION
 # ============================
+# Everything a phone number keeps is a digit or "+"
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+
+@_cached
 def normalize_phone(num: str) -> str:
     """Normalize phone number into a consistent format."""
     if not num:
         return "Unknown"
 
-    raw = "".join(ch for ch in str(num) if ch.isdigit() or ch == "+")
+    raw = _PHONE_STRIP_RE.sub("", str(num))
+    if not raw:
+        return "Unknown"
 
     # Already international
-    if raw.startswith("+"):
+    if raw[0] == "+":
         return raw
 
+    digits = raw.replace("+", "")
+    n = len(digits)
+
     # Handle Indian 10-digit numbers
-    digits = "".join(ch for ch in raw if ch.isdigit())
-    if len(digits) == 10:
+    if n == 10:
         return "+91" + digits
 
     # Handle 0-prefixed Indian numbers
-    if len(digits) == 11 and digits.startswith("0"):
+    if n == 11 and digits[0] == "0":
         return "+91" + digits[1:]
 
     # Fallback
@@ -33,25 +67,45 @@ def normalize_phone(num: str) -> str:
 # ============================
 # TIMESTAMP PARSER
 # ============================
+# Accepted formats grouped by the separator they need, in their original
+# precedence; a string is only tried against the group its shape allows
+_TS_DASH = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ")
+_TS_SLASH = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y", "%m/%d/%Y %H:%M:%S", "%m/%d/%Y")
+_TS_COMPACT = ("%Y%m%d",)
+
+
+def _timestamp_formats(s):
+    if "-" in s:
+        return _TS_DASH
+    if "/" in s:
+        return _TS_SLASH
+    # strptime's %d also takes a space-padded day
+    if s.replace(" ", "").isdigit():
+        return _TS_COMPACT
+    return ()
+
+
+# The first two dash formats, exactly as epoch_ms_to_str writes them;
+# datetime.fromisoformat parses these in C, several times faster than
+# strptime, with the same result
+_TS_ISO_FAST_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2})?", re.ASCII)
+
+
+@_cached
 def parse_timestamp(date_str):
     if not date_str or date_str == "Unknown":
         return None
 
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-        "%d/%m/%Y %H:%M:%S",
-        "%d/%m/%Y",
-        "%m/%d/%Y %H:%M:%S",
-        "%m/%d/%Y",
-        "%Y%m%d",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ",
-    ]
-
-    for fmt in formats:
+    date_str = str(date_str)
+    if _TS_ISO_FAST_RE.fullmatch(date_str):
         try:
-            dt = datetime.strptime(str(date_str), fmt)
+            return datetime.fromisoformat(date_str).timestamp()
+        except ValueError:
+            pass
+
+    for fmt in _timestamp_formats(date_str):
+        try:
+            dt = datetime.strptime(date_str, fmt)
             return dt.timestamp()
         except:
             continue
@@ -102,11 +156,52 @@ def format_device_info(log: dict):
 # ============================
 # CALL LOG FORMATTER
 # ============================
-def format_call_entry(call: dict, global_metadata=None):
-    global_metadata = global_metadata or {}
+_CALL_TYPE_MAP = {
+    "1": "incoming",
+    "2": "outgoing",
+    "3": "missed",
+    "4": "voicemail",
+    "5": "rejected",
+    "6": "blocked",
+}
+
+# Non-zero durations: below 30s brief, below 2min short, below 10min medium
+_DUR_BOUNDS = (30, 120, 600)
+_DUR_LABELS = ("brief", "short", "medium", "long")
+
+# Time-of-day label for each hour 0-23
+_HOUR_LABELS = tuple(
+    "morning" if 5 <= h < 12 else
+    "afternoon" if 12 <= h < 17 else
+    "evening" if 17 <= h < 21 else
+    "night"
+    for h in range(24)
+)
+
+# Timestamps past datetime's range (year 9999) get no time of day
+_MAX_TS = 253402300800
+
+
+@lru_cache(maxsize=4096)
+def _hour_offset(slot):
+    """
+    Local UTC offset, in seconds, throughout hour `slot` of the epoch, or
+    None when it changes within that hour (a DST or zone switch).
+    """
+    start = time.localtime(slot * 3600).tm_gmtoff
+    return start if time.localtime(slot * 3600 + 3599).tm_gmtoff == start else None
+
+
+def _utc_offset(ts):
+    """Local UTC offset at `ts`; rows in the same hour share one lookup."""
+    offset = _hour_offset(int(ts // 3600))
+    return offset if offset is not None else time.localtime(ts).tm_gmtoff
+
 
+def _call_fields(call, normalize=normalize_phone, parse_ts=parse_timestamp):
+    """Per-record parsing shared by format_call_entry and format_calls_bulk."""
     name = call.get("name") or "Unknown"
-    number = normalize_phone(call.get("number", "Unknown"))
+    number = normalize(call.get("number", "Unknown"))
 
     # Duration
     duration = call.get("duration_seconds", call.get("duration", 0))
@@ -115,57 +210,48 @@ def format_call_entry(call: dict, global_metadata=None):
     except:
         duration = 0.0
 
-    # Call direction
-    call_type = call.get("type", call.get("call_type", "unknown"))
-    type_map = {
-        "1": "incoming",
-        "2": "outgoing",
-        "3": "missed",
-        "4": "voicemail",
-        "5": "rejected",
-        "6": "blocked",
-    }
-    direction = type_map.get(str(call_type), str(call_type))
+    # Call direction; known codes map to literal (already interned)
+    # labels, and unmapped codes are interned so repeats share one string
+    call_type = str(call.get("type", call.get("call_type", "unknown")))
+    direction = _CALL_TYPE_MAP.get(call_type) or sys.intern(call_type)
 
     date = call.get("date", "Unknown")
-    ts = parse_timestamp(date)
+    ts = parse_ts(date)
+    return name, number, duration, direction, date, ts
+
+
+def format_call_entry(call: dict, global_metadata=None):
+    return _format_call(_call_fields(call), global_metadata or {})
+
+
+def _format_call(fields, global_metadata):
+    name, number, duration, direction, date, ts = fields
 
     # Duration categories
     if duration == 0:
         duration_category = "missed"
-    elif duration < 30:
-        duration_category = "brief"
-    elif duration < 120:
-        duration_category = "short"
-    elif duration < 600:
-        duration_category = "medium"
     else:
-        duration_category = "long"
+        duration_category = _DUR_LABELS[bisect_right(_DUR_BOUNDS, duration)]
 
     # Time of day
     time_category = "unknown"
     hour = None
-    if ts:
+    if ts and ts < _MAX_TS:
         try:
-            dt = datetime.fromtimestamp(ts)
-            hour = dt.hour
-            if 5 <= hour < 12:
-                time_category = "morning"
-            elif 12 <= hour < 17:
-                time_category = "afternoon"
-            elif 17 <= hour < 21:
-                time_category = "evening"
-            else:
-                time_category = "night"
+            # Local hour by arithmetic instead of a datetime per row
+            hour = int((ts + _utc_offset(ts)) // 3600 % 24)
+            time_category = _HOUR_LABELS[hour]
         except:
             pass
 
+    minutes = duration / 60
+
     doc = f"""CALL LOG ENTRY
 -------------------
 Name: {name}
 Number: {number}
 Direction: {direction}
-Duration: {duration} seconds ({duration/60:.2f} minutes)
+Duration: {duration} seconds ({minutes:.2f} minutes)
 Duration Category: {duration_category}
 Date: {date}
 Time of Day: {time_category}
@@ -176,7 +262,7 @@ Time of Day: {time_category}
         "name": name,
         "number": number,
         "duration_seconds": duration,
-        "duration_minutes": duration / 60,
+        "duration_minutes": minutes,
         "date": date,
         "timestamp": ts or 0.0,
         "call_direction": direction,
@@ -189,45 +275,99 @@ Time of Day: {time_category}
     }
 
     # Merge global metadata
-    for k, v in global_metadata.items():
-        meta[k] = v
+    meta.update(global_metadata)
 
     return doc, meta
 
 
+def _memo(fn):
+    """
+    Per-batch memo of a one-argument function over str args, keyed by the
+    string itself with no per-row key tuple. Anything else (1 and 1.0 are
+    equal keys but format differently) calls through to fn's own cache.
+    """
+    seen = {}
+
+    def lookup(arg):
+        if arg.__class__ is not str:
+            return fn(arg)
+        try:
+            return seen[arg]
+        except KeyError:
+            seen[arg] = result = fn(arg)
+            return result
+
+    return lookup
+
+
+def iter_calls_bulk(calls, global_metadata=None):
+    """
+    format_call_entry over a whole call list, yielding (doc, meta) as each
+    row is formatted so a large log is never held as one list of dicts.
+    A call log repeats a few hundred numbers (and often dates) across
+    thousands of rows, so each distinct value is normalized or parsed once
+    per batch.
+    """
+    global_metadata = global_metadata or {}
+    normalize = _memo(normalize_phone)
+    parse_ts = _memo(parse_timestamp)
+    for call in calls:
+        yield _format_call(_call_fields(call, normalize, parse_ts), global_metadata)
+
+
+def format_calls_bulk(calls, global_metadata=None):
+    """iter_calls_bulk as a list of (doc, meta)."""
+    return list(iter_calls_bulk(calls, global_metadata))
+
+
+
 # ============================
 # SMS FORMATTER
 # ============================
+# URL and urgency markers, found together in one pass over the body
+_SMS_KEYWORD_RE = re.compile(r"(?P<url>http|www\.)|(?P<urgent>urgent|asap|emergency)", re.IGNORECASE)
+_SMS_DIR = {"1": "received", "2": "sent"}
+_NO_KEYWORDS = frozenset()
+
 def format_sms_entry(sms: dict, global_metadata=None):
     global_metadata = global_metadata or {}
 
     address = normalize_phone(sms.get("address", "Unknown"))
     body = sms.get("body", "")
+    body_len = len(body)
     date = sms.get("date", "Unknown")
     ts = parse_timestamp(date)
 
-    msg_type = sms.get("type", sms.get("msg_type", "unknown"))
-    direction = "sent" if str(msg_type) == "2" else "received" if str(msg_type) == "1" else "unknown"
+    msg_type = str(sms.get("type", sms.get("msg_type", "unknown")))
+    direction = _SMS_DIR.get(msg_type, "unknown")
 
     keywords = []
-    body_lower = body.lower()
+    has_question = "?" in body
+    # Most bodies have no marker: one search settles those without
+    # building a set; otherwise collect the rest from the first hit on
+    first = _SMS_KEYWORD_RE.search(body)
+    found = _NO_KEYWORDS if first is None else {
+        m.lastgroup for m in _SMS_KEYWORD_RE.finditer(body, first.start())
+    }
+    has_url = "url" in found
 
-    if "?" in body:
+    if has_question:
         keywords.append("question")
 
-    if any(word in body_lower for word in ["http", "https", "www."]):
+    if has_url:
         keywords.append("has_url")
 
-    if any(word in body_lower for word in ["urgent", "asap", "emergency"]):
+    if "urgent" in found:
         keywords.append("urgent")
+    keyword_str = ", ".join(keywords) if keywords else "none"
 
     doc = f"""SMS MESSAGE
 -------------------
 Address: {address}
 Direction: {direction}
 Date: {date}
-Length: {len(body)} characters
-Keywords: {', '.join(keywords) if keywords else 'none'}
+Length: {body_len} characters
+Keywords: {keyword_str}
 
 Message:
 {body}
@@ -239,19 +379,15 @@ Message:
         "direction": direction,
         "date": date,
         "timestamp": ts or 0.0,
-        "body_length": len(body),
-        "has_question": "?" in body,
-        "has_url": any(x in body_lower for x in ["http", "https", "www."]),
-        "keywords": ", ".join(keywords) if keywords else "none",
+        "body_length": body_len,
+        "has_question": has_question,
+        "has_url": has_url,
+        "keywords": keyword_str,
         "word_count": len(body.split()),
     }
 
-    for k, v in sms.items():
-        if k not in meta:
-            meta[k] = v
-
-    for k, v in global_metadata.items():
-        meta[k] = v
+    # Record fields fill in around the computed ones; global metadata wins
+    meta = {**sms, **meta, **global_metadata}
 
     return doc, meta
 
@@ -259,26 +395,33 @@ Message:
 # ============================
 # CONTACT FORMATTER
 # ============================
+# Business and emergency name markers (plain substrings, as before),
+# classified together in one pass over the name. Zero-width, so
+# overlapping markers ("corpolice") are all seen.
+_CONTACT_KW_RE = re.compile(
+    r"(?=(?P<business>ltd|inc|corp|company|bank|service|support|customer|hospital|clinic|store)"
+    r"|(?P<emergency>police|ambulance|fire))",
+    re.IGNORECASE
+)
+_EMERGENCY_NUMBERS = frozenset({"911", "112", "100", "101", "102"})
+
 def format_contact_entry(contact: dict, global_metadata=None):
     global_metadata = global_metadata or {}
 
     name = contact.get("name") or contact.get("display_name") or "Unknown"
     number = normalize_phone(contact.get("number", contact.get("phone", "Unknown")))
     email = contact.get("email") or ""
+    email_label = email or "None"
 
-    name_lower = name.lower()
-    is_business = any(word in name_lower for word in [
-        "ltd", "inc", "corp", "company", "bank", "service",
-        "support", "customer", "hospital", "clinic", "store"
-    ])
-    is_emergency = number in ["911", "112", "100", "101", "102"] or \
-                   any(word in name_lower for word in ["police", "ambulance", "fire"])
+    found = {m.lastgroup for m in _CONTACT_KW_RE.finditer(name)}
+    is_business = "business" in found
+    is_emergency = number in _EMERGENCY_NUMBERS or "emergency" in found
 
     doc = f"""CONTACT ENTRY
 -------------------
 Name: {name}
 Number: {number}
-Email: {email or 'None'}
+Email: {email_label}
 Type: {"Business" if is_business else "Personal"}
 Emergency: {"Yes" if is_emergency else "No"}
 """
@@ -287,18 +430,14 @@ Emergency: {"Yes" if is_emergency else "No"}
         "type": "contact",
         "name": name,
         "number": number,
-        "email": email or "None",
+        "email": email_label,
         "is_business": is_business,
         "is_emergency": is_emergency,
         "has_email": bool(email),
     }
 
-    for k, v in contact.items():
-        if k not in meta:
-            meta[k] = v
-
-    for k, v in global_metadata.items():
-        meta[k] = v
+    # Record fields fill in around the computed ones; global metadata wins
+    meta = {**contact, **meta, **global_metadata}
 
     return doc, meta
 
@@ -306,42 +445,51 @@ Emergency: {"Yes" if is_emergency else "No"}
 # ============================
 # CONTACT RAW OUTPUT PARSER
 # ============================
-def parse_contacts_raw_output(raw_output, device_serial=None, log_timestamp=None):
+_CONTACT_LINE_RE = re.compile(r"([A-Za-z_]+):\s*(.*)")
+_CONTACT_START = "contact"
+
+def iter_contacts_raw_output(raw_output, device_serial=None, log_timestamp=None):
     """
-    Parse adb shell dumpsys raw_output to contact dicts.
+    Parse adb shell dumpsys raw_output to contact dicts, yielded one at a
+    time as each contact ends (already stamped with serial/timestamp).
     """
-    contacts = []
-
     if not raw_output:
-        return contacts
+        return
 
-    lines = raw_output.splitlines()
     current = {}
 
-    for line in lines:
+    def finish(contact):
+        contact["device_serial"] = device_serial
+        contact["log_timestamp"] = log_timestamp
+        return contact
+
+    # Iterate the text instead of materializing a list of every line
+    for line in io.StringIO(raw_output, newline=None):
         line = line.strip()
         if not line:
             continue
 
-        # Detect contact start
-        if line.lower().startswith("contact"):
+        # Detect contact start (any case). Field lines rarely begin with
+        # "c", so most are rejected on the first character before the
+        # prefix is sliced and lowercased
+        if line[0] in "cC" and line[:7].lower() == _CONTACT_START:
             if current:
-                contacts.append(current)
+                yield finish(current)
                 current = {}
             continue
 
-        m = re.match(r"([A-Za-z_]+):\s*(.*)", line)
+        m = _CONTACT_LINE_RE.match(line)
         if m:
             key, value = m.group(1), m.group(2)
             current[key] = value
             continue
 
     if current:
-        contacts.append(current)
+        yield finish(current)
 
-    # Add metadata
-    for c in contacts:
-        c["device_serial"] = device_serial
-        c["log_timestamp"] = log_timestamp
 
-    return contacts
+def parse_contacts_raw_output(raw_output, device_serial=None, log_timestamp=None):
+    """
+    Parse adb shell dumpsys raw_output to contact dicts.
+    """
+    return list(iter_contacts_raw_output(raw_output, device_serial, log_timestamp))
@@ -1,19 +1,20 @@
 # modules/ai/ai_indexer.py
 
 import json
+from itertools import islice
 from pathlib import Path
 import chromadb
-from modules.ai.ai_embedding import embed_text
+from modules.ai.ai_embedding import embed_text, embed_texts
 from datetime import datetime
 import re
 
 # NEW: use the formatter for clean, consistent forensic docs + metadata
 from modules.ai.ai_formatter import (
-    format_call_entry,
+    iter_calls_bulk,
     format_sms_entry,
     format_contact_entry,
     format_device_info,
-    parse_contacts_raw_output,
+    iter_contacts_raw_output,
 )
 
 
@@ -43,17 +44,28 @@ def _sanitize_value(value):
     return str(value)
 
 
+# Compiled once at import; these run for every raw SMS/call line indexed
+_PHONE_PATTERNS = [
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    re.compile(r'\d{10}'),
+    re.compile(r'\d{3}-\d{3}-\d{4}'),
+]
+
+_MODEL_RE = re.compile(r'model[:\s]+([^\n]+)', re.IGNORECASE)
+_ANDROID_RE = re.compile(r'android[:\s]+([0-9.]+)', re.IGNORECASE)
+_IOS_RE = re.compile(r'ios[:\s]+([0-9.]+)', re.IGNORECASE)
+_IMEI_RE = re.compile(r'imei[:\s]+([0-9]+)', re.IGNORECASE)
+
+
 def extract_phone_numbers(text: str):
     """Extract phone numbers from text for better searchability"""
-    patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-        r'\d{10}',
-        r'\d{3}-\d{3}-\d{4}',
-    ]
-    numbers = []
-    for pattern in patterns:
-        numbers.extend(re.findall(pattern, text))
-    return list(set(numbers))
+    # Every pattern needs a digit; skip the regex passes on text without one
+    if not any(ch.isdigit() for ch in text):
+        return []
+    numbers = set()
+    for pattern in _PHONE_PATTERNS:
+        numbers.update(pattern.findall(text))
+    return list(numbers)
 
 
 def parse_timestamp(date_str):
@@ -98,6 +110,32 @@ class SessionIndexer:
             metadata={"hnsw:space": "cosine"},
         )
 
+    # -----------------------------
+    # Batched insert
+    # -----------------------------
+    BATCH_SIZE = 256
+
+    def _add_batch(self, batch):
+        """
+        Embed and add (id, document, metadata) tuples in chunks, so the model
+        encodes many documents per forward pass instead of one at a time.
+        `batch` may be any iterable; a generator is consumed one chunk at a
+        time, so only BATCH_SIZE metadata dicts are alive at once. Returns
+        the number of records added.
+        """
+        batch = iter(batch)
+        count = 0
+        while chunk := list(islice(batch, self.BATCH_SIZE)):
+            count += len(chunk)
+            ids, docs, metas = zip(*chunk)
+            self.collection.add(
+                ids=list(ids),
+                embeddings=embed_texts(docs).tolist(),
+                metadatas=[flatten_metadata(m) for m in metas],
+                documents=list(docs),
+            )
+        return count
+
     # -----------------------------
     # Index Device Info (FORMATTED)
     # -----------------------------
@@ -139,25 +177,21 @@ class SessionIndexer:
                     "content_length": len(text),
                 }
 
-                # Simple regex-based enrichments for legacy logs
-                text_lower = text.lower()
+                # Simple regex-based enrichments for legacy logs; the
+                # patterns ignore case themselves, so no lowered copy of text
+                model_match = _MODEL_RE.search(text)
+                if model_match:
+                    meta["device_model"] = model_match.group(1).strip()
 
-                if "model" in text_lower:
-                    model_match = re.search(r'model[:\s]+([^\n]+)', text, re.IGNORECASE)
-                    if model_match:
-                        meta["device_model"] = model_match.group(1).strip()
+                version_match = _ANDROID_RE.search(text)
+                if version_match:
+                    meta["android_version"] = version_match.group(1).strip()
 
-                if "android" in text_lower:
-                    version_match = re.search(r'android[:\s]+([0-9.]+)', text, re.IGNORECASE)
-                    if version_match:
-                        meta["android_version"] = version_match.group(1).strip()
+                version_match = _IOS_RE.search(text)
+                if version_match:
+                    meta["ios_version"] = version_match.group(1).strip()
 
-                if "ios" in text_lower:
-                    version_match = re.search(r'ios[:\s]+([0-9.]+)', text, re.IGNORECASE)
-                    if version_match:
-                        meta["ios_version"] = version_match.group(1).strip()
-
-                imei_match = re.search(r'imei[:\s]+([0-9]+)', text, re.IGNORECASE)
+                imei_match = _IMEI_RE.search(text)
                 if imei_match:
                     meta["imei"] = imei_match.group(1).strip()
 
@@ -221,19 +255,15 @@ Searchable fields: device info, hardware, system, model, version
                 }
 
                 count = 0
+                batch = []
                 for i, sms in enumerate(records):
                     if not isinstance(sms, dict):
                         continue
                     doc, meta = format_sms_entry(sms, global_ctx)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"sms_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
+                    batch.append((f"sms_{f.name}_{i}", doc, meta))
                     count += 1
 
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {count} structured SMS records from {f.name}")
                 # Optionally index raw_output too, if present
                 if data.get("raw_output"):
@@ -255,60 +285,48 @@ Searchable fields: device info, hardware, system, model, version
             # LEGACY CASE 1 → whole file is raw string
             if isinstance(data, str):
                 lines = [line for line in data.splitlines() if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw SMS Line: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "sms_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                         "line_length": len(line),
                     }
-                    self.collection.add(
-                        ids=[f"sms_raw_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"sms_raw_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw SMS lines (legacy)")
                 continue
 
             # LEGACY CASE 2 → list of strings
             if isinstance(data, list) and all(isinstance(x, str) for x in data):
                 lines = [line for line in data if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw SMS Entry: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "sms_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                         "line_length": len(line),
                     }
-                    self.collection.add(
-                        ids=[f"sms_rawlist_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"sms_rawlist_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw SMS entries (legacy)")
                 continue
 
             # LEGACY CASE 3 → list of dicts
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
                 count = 0
+                batch = []
                 for i, sms in enumerate(data):
                     doc, meta = format_sms_entry(sms, global_context=None)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"sms_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
+                    batch.append((f"sms_{f.name}_{i}", doc, meta))
                     count += 1
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {count} SMS messages with formatted metadata (legacy list[dict])")
                 continue
 
@@ -366,19 +384,12 @@ Searchable fields: device info, hardware, system, model, version
                     "extraction_method": data.get("extraction_method"),
                 }
 
-                count = 0
-                for i, call in enumerate(records):
-                    if not isinstance(call, dict):
-                        continue
-                    doc, meta = format_call_entry(call, global_ctx)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"call_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
-                    count += 1
+                indexed = [(i, call) for i, call in enumerate(records) if isinstance(call, dict)]
+                formatted = iter_calls_bulk((call for _, call in indexed), global_ctx)
+                count = self._add_batch(
+                    (f"call_{f.name}_{i}", doc, meta)
+                    for (i, _), (doc, meta) in zip(indexed, formatted)
+                )
 
                 print(f"    ✓ Indexed {count} structured call records from {f.name}")
                 # Optionally index raw_output as a separate document
@@ -401,58 +412,43 @@ Searchable fields: device info, hardware, system, model, version
             # LEGACY CASE 1 – raw string dump
             if isinstance(data, str):
                 lines = [line for line in data.splitlines() if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw Call Line: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "call_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                     }
-                    self.collection.add(
-                        ids=[f"call_raw_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"call_raw_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw call lines (legacy)")
                 continue
 
             # LEGACY CASE 2 – list of strings
             if isinstance(data, list) and all(isinstance(x, str) for x in data):
                 lines = [line for line in data if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw Call Entry: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "call_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                     }
-                    self.collection.add(
-                        ids=[f"call_rawlist_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"call_rawlist_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw call entries (legacy)")
                 continue
 
             # LEGACY CASE 3 – list of dicts
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
-                count = 0
-                for i, call in enumerate(data):
-                    doc, meta = format_call_entry(call, global_context=None)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"call_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
-                    count += 1
+                count = self._add_batch(
+                    (f"call_{f.name}_{i}", doc, meta)
+                    for i, (doc, meta) in enumerate(iter_calls_bulk(data))
+                )
                 print(f"    ✓ Indexed {count} call records with formatted metadata (legacy list[dict])")
                 continue
 
@@ -512,91 +508,73 @@ Searchable fields: device info, hardware, system, model, version
                     "timestamp": timestamp,
                 }
 
+                all_records = []
+                for rec in records:
+                    if isinstance(rec, dict):
+                        all_records.append(rec)
+
                 # Some of your contacts logs have record_count=0, but raw_output with all rows
-                extra_from_raw = []
                 if data.get("raw_output"):
-                    extra_from_raw = parse_contacts_raw_output(
+                    all_records.extend(iter_contacts_raw_output(
                         data["raw_output"],
                         device_serial=device_serial,
                         log_timestamp=timestamp,
-                    )
-
-                all_records = []
-                for rec in records:
-                    if isinstance(rec, dict):
-                        all_records.append(rec)
-                all_records.extend(extra_from_raw)
+                    ))
 
                 count = 0
+                batch = []
                 for i, c in enumerate(all_records):
                     doc, meta = format_contact_entry(c, global_ctx)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"contact_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
+                    batch.append((f"contact_{f.name}_{i}", doc, meta))
                     count += 1
 
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {count} structured contacts from {f.name}")
                 continue
 
             # LEGACY CASE 1 – raw string
             if isinstance(data, str):
                 lines = [line for line in data.splitlines() if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw Contact Line: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "contact_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                     }
-                    self.collection.add(
-                        ids=[f"contact_raw_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"contact_raw_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw contact lines (legacy)")
                 continue
 
             # LEGACY CASE 2 – list of strings
             if isinstance(data, list) and all(isinstance(x, str) for x in data):
                 lines = [line for line in data if line.strip()]
+                batch = []
                 for i, line in enumerate(lines):
                     phone_numbers = extract_phone_numbers(line)
                     text = f"Raw Contact Entry: {line}\nExtracted numbers: {', '.join(phone_numbers)}"
-                    emb = embed_text(text)
                     meta = {
                         "type": "contact_raw",
                         "line": line,
                         "extracted_numbers": ", ".join(phone_numbers) if phone_numbers else "None",
                     }
-                    self.collection.add(
-                        ids=[f"contact_rawlist_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[text],
-                    )
+                    batch.append((f"contact_rawlist_{f.name}_{i}", text, meta))
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {len(lines)} raw contact entries (legacy)")
                 continue
 
             # LEGACY CASE 3 – list of dicts
             if isinstance(data, list) and all(isinstance(x, dict) for x in data):
                 count = 0
+                batch = []
                 for i, c in enumerate(data):
                     doc, meta = format_contact_entry(c, global_context=None)
-                    emb = embed_text(doc)
-                    self.collection.add(
-                        ids=[f"contact_{f.name}_{i}"],
-                        embeddings=[emb],
-                        metadatas=[flatten_metadata(meta)],
-                        documents=[doc],
-                    )
+                    batch.append((f"contact_{f.name}_{i}", doc, meta))
                     count += 1
+                self._add_batch(batch)
                 print(f"    ✓ Indexed {count} contacts with formatted metadata (legacy list[dict])")
                 continue
 
@@ -26,7 +26,7 @@ from collections import Counter
 from datetime import datetime
 import chromadb
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -118,6 +118,38 @@ def _extract_phone_numbers_from_question(q: str) -> List[str]:
     return normed
 
 
+# ---------------------------------------------------------------------------
+# Prompt prefix
+# ---------------------------------------------------------------------------
+
+# Identical for every question, so it is built once and sent first: providers
+# that cache prompt prefixes (Groq does for supported models) can reuse it.
+QUERY_SYSTEM_PROMPT = """
+You are a **digital forensics analyst** specializing in **Android mobile device forensics**.
+
+You are given:
+- User's natural-language question
+- Structured forensic context (calls, SMS, contacts, device info)
+
+YOUR JOB:
+1. Answer the question as clearly as possible.
+2. Base everything on the context; do NOT invent records that are not present.
+3. You MAY:
+   - infer patterns (e.g., "frequent night calls to X", "mostly short calls")
+   - reason about likely behavior based on the data
+   - correlate calls, SMS, contacts logically
+4. You MUST:
+   - clearly state if the data is missing, incomplete, or limited
+   - avoid claiming that specific calls/SMS exist if the context suggests none
+   - identify concrete evidence when making claims (e.g., "there are 12 calls to this number")
+
+FORMAT:
+- Start with a 2–3 line high-level conclusion.
+- Then provide bullet-pointed evidence referencing the data.
+- End with a short 'Forensic Notes' section mentioning limitations or caveats.
+"""
+
+
 # ---------------------------------------------------------------------------
 # AI Query Engine
 # ---------------------------------------------------------------------------
@@ -999,26 +1031,22 @@ Emergency Contacts : {emergency}
     # PUBLIC ENTRYPOINT
     # -----------------------------------------------------------------------
 
-    def query(self, question: str, k: int = 12) -> str:
+    def _prepare(self, question: str, k: int) -> Tuple[Optional[str], Optional[str]]:
         """
-        Entry point used by your Flask app.
+        Shared front half of query()/stream().
 
-        Strategy:
-        1. Try structured analytics / deterministic logic.
-        2. If a deterministic 'direct_answer' exists → return it immediately.
-        3. If we have 'analytical_context' → LLM explains and interprets it.
-        4. Otherwise → semantic search + LLM (Smart Chat Mode).
+        Returns (direct_answer, prompt); exactly one of them is set.
         """
         question = (question or "").strip()
         if not question:
-            return "No question provided."
+            return "No question provided.", None
 
         # First: structured analytics
         analytical_context, direct_answer = self._handle_analytical_query(question)
 
         # Deterministic short answer (e.g., "No data found for this number")
         if direct_answer:
-            return direct_answer
+            return direct_answer, None
 
         # Build context for LLM
         if analytical_context:
@@ -1029,31 +1057,9 @@ Emergency Contacts : {emergency}
         # Trim to avoid Groq 400 errors
         context = self._trim_context(context)
 
-        # Smart Chat forensic prompt
+        # Only the question and context vary; the instructions go out as a
+        # fixed system prefix (see QUERY_SYSTEM_PROMPT)
         prompt = f"""
-You are a **digital forensics analyst** specializing in **Android mobile device forensics**.
-
-You are given:
-- User's natural-language question
-- Structured forensic context (calls, SMS, contacts, device info)
-
-YOUR JOB:
-1. Answer the question as clearly as possible.
-2. Base everything on the context; do NOT invent records that are not present.
-3. You MAY:
-   - infer patterns (e.g., "frequent night calls to X", "mostly short calls")
-   - reason about likely behavior based on the data
-   - correlate calls, SMS, contacts logically
-4. You MUST:
-   - clearly state if the data is missing, incomplete, or limited
-   - avoid claiming that specific calls/SMS exist if the context suggests none
-   - identify concrete evidence when making claims (e.g., "there are 12 calls to this number")
-
-FORMAT:
-- Start with a 2–3 line high-level conclusion.
-- Then provide bullet-pointed evidence referencing the data.
-- End with a short 'Forensic Notes' section mentioning limitations or caveats.
-
 USER QUESTION:
 {question}
 
@@ -1062,11 +1068,49 @@ FORENSIC CONTEXT:
 
 Now provide your professional forensic analysis in clear, concise English.
 """
+        return None, prompt
 
-        resp = self.client.chat.completions.create(
+    def _complete(self, prompt: str, stream: bool = False):
+        return self.client.chat.completions.create(
             model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
+            messages=[
+                {"role": "system", "content": QUERY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
             temperature=0.45,  # slightly higher for smarter "chat" but still grounded
+            stream=stream,
         )
 
+    def query(self, question: str, k: int = 12) -> str:
+        """
+        Entry point used by your Flask app.
+
+        Strategy:
+        1. Try structured analytics / deterministic logic.
+        2. If a deterministic 'direct_answer' exists → return it immediately.
+        3. If we have 'analytical_context' → LLM explains and interprets it.
+        4. Otherwise → semantic search + LLM (Smart Chat Mode).
+        """
+        direct_answer, prompt = self._prepare(question, k)
+        if direct_answer:
+            return direct_answer
+
+        resp = self._complete(prompt)
         return resp.choices[0].message.content
+
+    def stream(self, question: str, k: int = 12) -> Iterator[str]:
+        """
+        Same as query(), but yields the answer in chunks as Groq produces them.
+        Deterministic answers are yielded as a single chunk.
+        """
+        direct_answer, prompt = self._prepare(question, k)
+        if direct_answer:
+            yield direct_answer
+            return
+
+        for chunk in self._complete(prompt, stream=True):
+            if not chunk.choices:
+                continue
+            token = chunk.choices[0].delta.content
+            if token:
+                yield token
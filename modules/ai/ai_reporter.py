@@ -11,6 +11,62 @@ def shrink_text(text: str, max_chars: int = 800):
         return text
     return text[:max_chars] + "\n...[truncated]..."
 
+# Report structure and rules never change, so they form a fixed system prefix
+# ahead of the per-session data (lets prefix-caching providers reuse it)
+REPORT_SYSTEM_PROMPT = """
+Generate a professional, comprehensive digital forensic report.
+
+REQUIRED SECTIONS:
+1. Executive Summary
+   - Brief overview of the investigation
+   - Key findings at a glance
+
+2. Device Overview
+   - Device model, OS, identifiers
+   - Collection date and method
+
+3. Communication Patterns Analysis
+   - Overall communication behavior
+   - Peak activity times/periods
+   - Communication frequency trends
+
+4. Call Log Analysis
+   - Total calls and duration statistics
+   - Most frequent contacts
+   - Call patterns and anomalies
+   - Longest/shortest calls
+
+5. SMS Message Analysis
+   - Total messages and volume
+   - Most frequent contacts
+   - Message content themes (if visible)
+   - Notable patterns
+
+6. Contact Database Review
+   - Total contacts stored
+   - Contact organization
+   - Notable entries
+
+7. Suspicious or Notable Indicators
+   - Unusual patterns
+   - Red flags or concerns
+   - Deleted or hidden data indicators
+   - Timing anomalies
+
+8. Conclusions and Recommendations
+   - Summary of findings
+   - Suggested follow-up actions
+   - Areas requiring additional investigation
+
+INSTRUCTIONS:
+- Be professional and objective
+- Use specific numbers and statistics from the data
+- Highlight patterns and anomalies
+- Keep each section concise but informative
+- Base ALL conclusions on actual data provided
+- Use forensic terminology appropriately
+"""
+
 class ForensicReporter:
     def __init__(self, api_key: str, session_path: str | Path):
         self.client = Groq(api_key=api_key)
@@ -108,6 +164,10 @@ Top 5 Most Messaged Contacts:
         return stats
 
     def generate_report(self):
+        # Nothing indexed yet: skip the stats queries, embedding and LLM call
+        if self.collection.count() == 0:
+            return "No indexed data found for this session. Run indexing first, then generate the report."
+
         # Gather structured statistics
         stats = self._gather_statistics()
         
@@ -143,67 +203,18 @@ Top 5 Most Messaged Contacts:
 """
 
         prompt = f"""
-Generate a professional, comprehensive digital forensic report.
-
-REQUIRED SECTIONS:
-1. Executive Summary
-   - Brief overview of the investigation
-   - Key findings at a glance
-
-2. Device Overview
-   - Device model, OS, identifiers
-   - Collection date and method
-
-3. Communication Patterns Analysis
-   - Overall communication behavior
-   - Peak activity times/periods
-   - Communication frequency trends
-
-4. Call Log Analysis
-   - Total calls and duration statistics
-   - Most frequent contacts
-   - Call patterns and anomalies
-   - Longest/shortest calls
-
-5. SMS Message Analysis
-   - Total messages and volume
-   - Most frequent contacts
-   - Message content themes (if visible)
-   - Notable patterns
-
-6. Contact Database Review
-   - Total contacts stored
-   - Contact organization
-   - Notable entries
-
-7. Suspicious or Notable Indicators
-   - Unusual patterns
-   - Red flags or concerns
-   - Deleted or hidden data indicators
-   - Timing anomalies
-
-8. Conclusions and Recommendations
-   - Summary of findings
-   - Suggested follow-up actions
-   - Areas requiring additional investigation
-
 FORENSIC DATA:
 {full_context}
 
-INSTRUCTIONS:
-- Be professional and objective
-- Use specific numbers and statistics from the data
-- Highlight patterns and anomalies
-- Keep each section concise but informative
-- Base ALL conclusions on actual data provided
-- Use forensic terminology appropriately
-
 Generate the complete forensic report now:
 """
 
         resp = self.client.chat.completions.create(
             model="llama-3.3-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
+            messages=[
+                {"role": "system", "content": REPORT_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
             temperature=0.3  # Lower temperature for more factual output
         )
 
@@ -0,0 +1,70 @@
+import atexit
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import closing
+
+# Directories made by ManifestStore.write_temp(); removed when the app exits
+_TEMP_DIRS = []
+
+
+@atexit.register
+def _remove_temp_dirs():
+    for d in _TEMP_DIRS:
+        shutil.rmtree(d, ignore_errors=True)
+
+
+class ManifestStore:
+    """
+    Extraction manifest kept in an on-disk SQLite file instead of in memory.
+
+    Behaves like a read-only list of manifest entries (len, index, iterate),
+    loading each entry from disk on access. Connections are opened per call
+    so the store can be written in a worker and read from any thread.
+    """
+
+    def __init__(self, path, count):
+        self.path = str(path)
+        self._count = count
+
+    @classmethod
+    def write(cls, path, manifest):
+        """Persist a manifest list to `path` (replacing any previous one)."""
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute("CREATE TABLE entries (idx INTEGER PRIMARY KEY, entry TEXT NOT NULL)")
+            conn.executemany(
+                "INSERT INTO entries (idx, entry) VALUES (?, ?)",
+                ((i, json.dumps(entry)) for i, entry in enumerate(manifest)),
+            )
+        return cls(path, len(manifest))
+
+    @classmethod
+    def write_temp(cls, manifest):
+        """
+        write() into a fresh private temp directory, never into the
+        extraction folder: that is evidence, and a later scan or BIN of it
+        would pick the store up as a device file.
+        """
+        d = tempfile.mkdtemp(prefix="mobilytix_manifest_")
+        _TEMP_DIRS.append(d)
+        return cls.write(os.path.join(d, "manifest.sqlite"), manifest)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, idx):
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("manifest index out of range")
+        with closing(sqlite3.connect(self.path)) as conn:
+            row = conn.execute("SELECT entry FROM entries WHERE idx = ?", (idx,)).fetchone()
+        return json.loads(row[0])
+
+    def __iter__(self):
+        with closing(sqlite3.connect(self.path)) as conn:
+            for (entry,) in conn.execute("SELECT entry FROM entries ORDER BY idx"):
+                yield json.loads(entry)
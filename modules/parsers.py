@@ -1,6 +1,49 @@
 import re
 from modules.adb_utils import epoch_ms_to_str
 
+# -----------------------------
+# Compiled patterns
+# -----------------------------
+# Built once at import; the parsers run them over whole dumps and per line
+
+# SMS
+_SMS_ROW_RE = re.compile(
+    r'address=(?P<address>.*?),\s*date=(?P<date>\d+),\s*body=(?P<body>.*?)(?=(?:\nRow)|\Z)',
+    re.DOTALL
+)
+_SMS_LINE_RE = re.compile(
+    r'address=(?P<addr>.*?),\s*date=(?P<date>\d+).*?body=(?P<body>.*?)(?:,\s*type=|$)',
+    re.DOTALL
+)
+_SMS_ALT_RES = [
+    re.compile(r'phone_number=(?P<addr>.*?),\s*date=(?P<date>\d+).*?message=(?P<body>.*?)(?:,|$)', re.DOTALL),
+    re.compile(r'sender=(?P<addr>.*?),\s*timestamp=(?P<date>\d+).*?text=(?P<body>.*?)(?:,|$)', re.DOTALL),
+    re.compile(r'number=(?P<addr>.*?),\s*date_sent=(?P<date>\d+).*?body=(?P<body>.*?)(?:,|$)', re.DOTALL),
+]
+
+# Contacts
+_CONTACT_ROW_RE = re.compile(
+    r'Row:\s*\d+\s+display_name=(?P<name>.*?),\s*data1=(?P<number>[\+\d\s\(\)-]+)',
+    re.IGNORECASE
+)
+
+# Calls
+_CALL_ROW_RE = re.compile(
+    r'(?:name|cached_name)=(?P<name>.*?),\s*number=(?P<number>.*?),\s*duration=(?P<duration>\d+),\s*date=(?P<date>\d+)',
+    re.IGNORECASE
+)
+_CALL_NAME_RE = re.compile(r'(?:name|cached_name)=(.*?)(?:,|$)', re.IGNORECASE)
+_CALL_NUMBER_RE = re.compile(r'number=(.*?)(?:,|$)', re.IGNORECASE)
+_CALL_DURATION_RE = re.compile(r'duration=(\d+)', re.IGNORECASE)
+_CALL_DATE_RE = re.compile(r'date=(\d+)', re.IGNORECASE)
+_CALL_ALT_RES = [
+    re.compile(r'caller_name=(?P<name>.*?),\s*phone_number=(?P<number>.*?),\s*call_duration=(?P<duration>\d+),\s*timestamp=(?P<date>\d+)', re.IGNORECASE),
+    re.compile(r'contact=(?P<name>.*?),\s*number=(?P<number>.*?),\s*duration=(?P<duration>\d+),\s*time=(?P<date>\d+)', re.IGNORECASE),
+]
+
+# Generic key=value fallback shared by SMS and calls
+_KV_RE = re.compile(r'(\w+)=(.*?)(?:,\s*\w+=|$)')
+
 def safe_strip(value):
     """Safely strip a value that might be None"""
     if value is None:
@@ -37,11 +80,7 @@ def parse_sms_text(raw_text):
     # ==================== STRATEGY 1: Multi-line grouped pattern ====================
     # Matches: address=..., date=..., body=...
     # Works across multiple lines until next "Row" marker
-    row_re = re.compile(
-        r'address=(?P<address>.*?),\s*date=(?P<date>\d+),\s*body=(?P<body>.*?)(?=(?:\nRow)|\Z)', 
-        re.DOTALL
-    )
-    for m in row_re.finditer(text):
+    for m in _SMS_ROW_RE.finditer(text):
         addr = safe_group(m, "address")
         date_ms = safe_group(m, "date")
         body = safe_group(m, "body")
@@ -59,11 +98,11 @@ def parse_sms_text(raw_text):
     
     # ==================== STRATEGY 2: Single-line pattern ====================
     # Xiaomi/MIUI often returns single-line format
-    for line in text.splitlines():
+    for line in lines:
         if "address=" in line and "date=" in line and "body=" in line:
             try:
                 # Try comprehensive regex
-                match = re.search(r'address=(?P<addr>.*?),\s*date=(?P<date>\d+).*?body=(?P<body>.*?)(?:,\s*type=|$)', line, re.DOTALL)
+                match = _SMS_LINE_RE.search(line)
                 if match:
                     addr = safe_group(match, "addr")
                     date_ms = safe_group(match, "date")
@@ -83,16 +122,10 @@ def parse_sms_text(raw_text):
     
     # ==================== STRATEGY 3: Alternate column names ====================
     # Some devices use "phone_number" instead of "address", "message" instead of "body"
-    alt_patterns = [
-        (r'phone_number=(?P<addr>.*?),\s*date=(?P<date>\d+).*?message=(?P<body>.*?)(?:,|$)', "phone_number"),
-        (r'sender=(?P<addr>.*?),\s*timestamp=(?P<date>\d+).*?text=(?P<body>.*?)(?:,|$)', "sender"),
-        (r'number=(?P<addr>.*?),\s*date_sent=(?P<date>\d+).*?body=(?P<body>.*?)(?:,|$)', "number"),
-    ]
-    
-    for pattern, label in alt_patterns:
-        for line in text.splitlines():
+    for pattern in _SMS_ALT_RES:
+        for line in lines:
             try:
-                match = re.search(pattern, line, re.DOTALL)
+                match = pattern.search(line)
                 if match:
                     addr = safe_group(match, "addr")
                     date_ms = safe_group(match, "date")
@@ -112,13 +145,13 @@ def parse_sms_text(raw_text):
     
     # ==================== STRATEGY 4: Key-value pair extraction ====================
     # Last resort: extract any key=value pairs we can find
-    for line in text.splitlines():
+    for line in lines:
         if not line.strip() or line.startswith("Row:"):
             continue
         
         try:
             # Extract all key=value pairs
-            pairs = re.findall(r'(\w+)=(.*?)(?:,\s*\w+=|$)', line)
+            pairs = _KV_RE.findall(line)
             data = {k: v.strip() for k, v in pairs}
             
             # Try to find address-like and body-like fields
@@ -152,13 +185,8 @@ def parse_contacts_text(raw_text):
     if not raw_text:
         return results
     
-    # Regex for your exact format
-    pattern = re.compile(
-        r'Row:\s*\d+\s+display_name=(?P<name>.*?),\s*data1=(?P<number>[\+\d\s\(\)-]+)',
-        re.IGNORECASE
-    )
-    
-    for match in pattern.finditer(raw_text):
+    # Regex for your exact format (_CONTACT_ROW_RE)
+    for match in _CONTACT_ROW_RE.finditer(raw_text):
         name = match.group("name").strip()
         number = match.group("number").strip()
         results.append({
@@ -189,11 +217,7 @@ def parse_calls_text(raw_text):
         return results
     
     # ==================== STRATEGY 1: Standard format ====================
-    pattern = re.compile(
-        r'(?:name|cached_name)=(?P<name>.*?),\s*number=(?P<number>.*?),\s*duration=(?P<duration>\d+),\s*date=(?P<date>\d+)',
-        re.IGNORECASE
-    )
-    for m in pattern.finditer(text):
+    for m in _CALL_ROW_RE.finditer(text):
         name = safe_group(m, "name")
         number = safe_group(m, "number")
         duration = safe_group(m, "duration")
@@ -211,13 +235,13 @@ def parse_calls_text(raw_text):
         return results
     
     # ==================== STRATEGY 2: Line-by-line ====================
-    for line in text.splitlines():
+    for line in lines:
         if 'duration=' in line and 'date=' in line:
             try:
-                name_match = re.search(r'(?:name|cached_name)=(.*?)(?:,|$)', line, re.IGNORECASE)
-                number_match = re.search(r'number=(.*?)(?:,|$)', line, re.IGNORECASE)
-                duration_match = re.search(r'duration=(\d+)', line, re.IGNORECASE)
-                date_match = re.search(r'date=(\d+)', line, re.IGNORECASE)
+                name_match = _CALL_NAME_RE.search(line)
+                number_match = _CALL_NUMBER_RE.search(line)
+                duration_match = _CALL_DURATION_RE.search(line)
+                date_match = _CALL_DATE_RE.search(line)
                 
                 name = safe_strip(name_match.group(1)) if name_match else ""
                 number = safe_strip(number_match.group(1)) if number_match else ""
@@ -238,13 +262,8 @@ def parse_calls_text(raw_text):
         return results
     
     # ==================== STRATEGY 3: Alternate formats ====================
-    alt_patterns = [
-        r'caller_name=(?P<name>.*?),\s*phone_number=(?P<number>.*?),\s*call_duration=(?P<duration>\d+),\s*timestamp=(?P<date>\d+)',
-        r'contact=(?P<name>.*?),\s*number=(?P<number>.*?),\s*duration=(?P<duration>\d+),\s*time=(?P<date>\d+)',
-    ]
-    
-    for pattern in alt_patterns:
-        for m in re.finditer(pattern, text, re.IGNORECASE):
+    for pattern in _CALL_ALT_RES:
+        for m in pattern.finditer(text):
             name = safe_group(m, "name")
             number = safe_group(m, "number")
             duration = safe_group(m, "duration")
@@ -262,12 +281,12 @@ def parse_calls_text(raw_text):
             return results
     
     # ==================== STRATEGY 4: Generic key-value ====================
-    for line in text.splitlines():
+    for line in lines:
         if not line.strip() or line.startswith("Row:"):
             continue
         
         try:
-            pairs = re.findall(r'(\w+)=(.*?)(?:,\s*\w+=|$)', line)
+            pairs = _KV_RE.findall(line)
             data = {k.lower(): v.strip() for k, v in pairs}
             
             name = (data.get("name") or data.get("cached_name") or 
@@ -298,19 +317,23 @@ def parse_calls_text(raw_text):
 # Manifest parsing
 # -----------------------------
 def manifest_to_table_rows(manifest):
-    """Convert manifest to table format for display"""
+    """
+    Convert manifest to table format for display.
+
+    Returns (headers, columns): one pre-stringified list per header, which
+    the GUI's column-wise table model indexes directly.
+    """
     headers = ["Remote Path", "Local Path", "Size", "MD5", "SHA1", "SHA256"]
-    rows = []
     if not isinstance(manifest, list):
-        return headers, rows
-    for entry in manifest:
-        hashes = entry.get("hashes", {}) or {}
-        rows.append([
-            entry.get("remote_path", ""),
-            entry.get("local_path", ""),
-            entry.get("size", 0),
-            hashes.get("md5", ""),
-            hashes.get("sha1", ""),
-            hashes.get("sha256", "")
-        ])
-    return headers, rows
\ No newline at end of file
+        return headers, [[] for _ in headers]
+
+    hashes = [entry.get("hashes", {}) or {} for entry in manifest]
+    columns = [
+        [str(entry.get("remote_path", "")) for entry in manifest],
+        [str(entry.get("local_path", "")) for entry in manifest],
+        [str(entry.get("size", 0)) for entry in manifest],
+        [str(h.get("md5", "")) for h in hashes],
+        [str(h.get("sha1", "")) for h in hashes],
+        [str(h.get("sha256", "")) for h in hashes],
+    ]
+    return headers, columns
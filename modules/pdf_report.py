@@ -0,0 +1,295 @@
+from datetime import datetime
+from functools import lru_cache
+from html import escape
+from io import StringIO
+
+# HTML→PDF report layout (WeasyPrint); mirrors the ReportLab layout below
+PDF_CSS = """
+@page {
+    size: letter;
+    margin: 1in 0.8in 0.8in 0.8in;
+    @bottom-right {
+        content: "Mobilytix Forensic Report \\2013  Page " counter(page);
+        font: 9pt Helvetica, sans-serif;
+        color: gray;
+    }
+}
+body { font: 11pt/15pt Helvetica, sans-serif; color: black; }
+.header {
+    background: #003366; color: white; font: bold 16pt/20pt Helvetica, sans-serif;
+    padding: 6px; margin-bottom: 12px;
+}
+table.meta { font-size: 9pt; color: #333333; margin-bottom: 0.25in; }
+table.meta th { text-align: right; font-weight: normal; padding: 0 8px 4px 0; }
+h1, h2, h3 { color: #003366; font: bold 14pt/18pt Helvetica, sans-serif; }
+table { border-collapse: collapse; }
+td, th { padding: 2px 6px; }
+pre, code { font-family: Courier, monospace; font-size: 9pt; }
+"""
+
+PDF_HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head><body>
+<div class="header">Mobilytix Forensic Report</div>
+<table class="meta">
+<tr><th>Generated On:</th><td>{generated}</td></tr>
+<tr><th>Generated By:</th><td>Mobilytix Forensic Engine</td></tr>
+<tr><th>Session:</th><td>{session}</td></tr>
+</table>
+{body}
+</body></html>"""
+
+
+def markdown_to_html(md_text):
+    """
+    Render AI markdown to HTML; None if `markdown` isn't installed.
+
+    The report is model output built from device evidence (SMS bodies,
+    contact names), so it is treated as untrusted: raw HTML is escaped
+    rather than passed through, and images keep only data: sources, so
+    rendering never loads a local file or a remote URL.
+    """
+    try:
+        import markdown
+        from markdown.treeprocessors import Treeprocessor
+    except ImportError:
+        return None
+
+    class DataImagesOnly(Treeprocessor):
+        def run(self, root):
+            for img in root.iter("img"):
+                if not img.get("src", "").lower().startswith("data:"):
+                    img.attrib.pop("src", None)
+
+    md = markdown.Markdown(extensions=["fenced_code", "tables"])
+    md.preprocessors.deregister("html_block")
+    md.inlinePatterns.deregister("html")
+    md.treeprocessors.register(DataImagesOnly(md), "data_images_only", 0)
+    return md.convert(md_text)
+
+
+def _data_url_fetcher(url, *args, **kwargs):
+    """WeasyPrint url_fetcher that only resolves inline data: URLs."""
+    from weasyprint import default_url_fetcher
+
+    if not url.lower().startswith("data:"):
+        raise ValueError(f"external resource refused: {url}")
+    return default_url_fetcher(url, *args, **kwargs)
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# -----------------------------
+# WeasyPrint
+# -----------------------------
+def save_pdf_html(md_text, output_path, session):
+    """
+    markdown → HTML → PDF via WeasyPrint. Returns False (nothing written)
+    when WeasyPrint or markdown isn't installed.
+    """
+    try:
+        from weasyprint import HTML, CSS
+    except ImportError:
+        return False
+    body = markdown_to_html(md_text)
+    if body is None:
+        return False
+
+    page = PDF_HTML.format(generated=_now(), session=escape(str(session)), body=body)
+    HTML(string=page, url_fetcher=_data_url_fetcher).write_pdf(
+        output_path, stylesheets=[CSS(string=PDF_CSS, url_fetcher=_data_url_fetcher)]
+    )
+    return True
+
+
+# -----------------------------
+# ReportLab
+# -----------------------------
+@lru_cache(maxsize=1)
+def _styles():
+    """Paragraph and table styles, built once per process on first use."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+
+    sample = getSampleStyleSheet()
+    return {
+        # Base body style
+        "body": ParagraphStyle(
+            "Body",
+            parent=sample["Normal"],
+            fontName="Helvetica",
+            fontSize=11,
+            leading=15,
+            textColor=colors.black
+        ),
+        # Section title style
+        "section": ParagraphStyle(
+            "SectionTitle",
+            parent=sample["Heading2"],
+            fontName="Helvetica-Bold",
+            fontSize=14,
+            leading=18,
+            spaceAfter=12,
+            textColor=colors.HexColor("#003366")
+        ),
+        # Header bar
+        "header": ParagraphStyle(
+            "Header",
+            fontName="Helvetica-Bold",
+            fontSize=16,
+            textColor=colors.white,
+            backColor=colors.HexColor("#003366"),
+            leftIndent=0,
+            alignment=0,
+            spaceAfter=12,
+            leading=20,
+            borderPadding=(6, 6, 6, 6),
+        ),
+        # Metadata block
+        "meta_table": TableStyle([
+            ("FONT", (0, 0), (-1, -1), "Helvetica", 9),
+            ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#333333")),
+            ("ALIGN", (0, 0), (0, -1), "RIGHT"),
+            ("ALIGN", (1, 0), (1, -1), "LEFT"),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+        ]),
+    }
+
+
+@lru_cache(maxsize=4)
+def _markdown_blocks(md_text):
+    """
+    md_text parsed once per distinct text, so repeated "Download Report as
+    PDF" clicks skip the parse. A tuple of (style name, text) blocks, with
+    (None, None) for the wider gap a blank line leaves after a block. Only
+    plain data is cached: flowables are mutated by layout, so each save
+    builds its own (see markdown_story).
+    """
+    blocks = []
+
+    # Walk the text line by line (no full-size split list or cleaned copy)
+    # and emit one block per run of consecutive lines, joined with <br/>:
+    # layout cost follows the number of flowables, not text length
+    lines = []
+
+    def end_block():
+        if not lines:
+            return False
+        blocks.append(("body", "<br/>".join(lines)))
+        lines.clear()
+        return True
+
+    for line in StringIO(md_text):
+        stripped = line.replace("**", "").strip()
+
+        if not stripped:
+            if end_block():
+                blocks.append((None, None))
+            continue
+
+        # Detect headers (always a flowable of their own)
+        if stripped.startswith("# ") or stripped.startswith("## "):
+            end_block()
+            title = stripped[2:] if stripped.startswith("# ") else stripped[3:]
+            blocks.append(("section", title))
+        else:
+            lines.append(stripped)
+
+    end_block()
+    return tuple(blocks)
+
+
+def markdown_story(md_text):
+    """Report body flowables for md_text, freshly built for each save."""
+    from reportlab.platypus import Paragraph, Spacer
+    from reportlab.lib.units import inch
+
+    styles = _styles()
+    story = []
+    for style, text in _markdown_blocks(md_text):
+        if style is None:
+            story.append(Spacer(1, 0.20 * inch))
+            continue
+        story.append(Paragraph(text, styles[style]))
+        story.append(Spacer(1, 0.12 * inch))
+    return story
+
+
+def _header_story(session):
+    """Header bar and metadata block that open the report."""
+    from reportlab.platypus import Paragraph, Spacer, Table
+    from reportlab.lib.units import inch
+
+    styles = _styles()
+    story = []
+
+    # -----------------------------
+    # HEADER BAR
+    # -----------------------------
+    story.append(
+        Paragraph(
+            "<font color='#FFFFFF'><b>Mobilytix Forensic Report</b></font>",
+            styles["header"]
+        )
+    )
+
+    # -----------------------------
+    # METADATA BLOCK
+    # -----------------------------
+    metadata = [
+        ["Generated On:", _now()],
+        ["Generated By:", "Mobilytix Forensic Engine"],
+        ["Session:", session],
+    ]
+
+    table = Table(metadata, colWidths=[1.6 * inch, 4.8 * inch])
+    table.setStyle(styles["meta_table"])
+    story.append(table)
+    story.append(Spacer(1, 0.25 * inch))
+    return story
+
+
+def _draw_footer(canvas, page):
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
+    canvas.saveState()
+    canvas.setFont("Helvetica", 9)
+    canvas.setFillColor(colors.gray)
+    canvas.drawRightString(
+        7.5 * inch, 0.55 * inch,
+        f"Mobilytix Forensic Report – Page {page}"
+    )
+    canvas.restoreState()
+
+
+def _build(story, output_path):
+    """Lay out `story` into output_path, with the page footer on every page."""
+    from reportlab.platypus import SimpleDocTemplate
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.lib.units import inch
+
+    doc = SimpleDocTemplate(
+        output_path,
+        pagesize=LETTER,
+        leftMargin=0.8 * inch,
+        rightMargin=0.8 * inch,
+        topMargin=1 * inch,
+        bottomMargin=0.8 * inch
+    )
+    on_page = lambda canvas, doc: _draw_footer(canvas, doc.page)
+    doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+
+
+def save_pdf(md_text, output_path, session="Unknown"):
+    """Generate a clean, formal forensic-style PDF from markdown text."""
+    # Whole report laid out by an HTML engine when available;
+    # ReportLab is the fallback
+    if save_pdf_html(md_text, output_path, session):
+        return
+
+    story = _header_story(session)
+    story.extend(markdown_story(md_text))
+    _build(story, output_path)
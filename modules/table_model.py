@@ -0,0 +1,184 @@
+import unicodedata
+from bisect import bisect_right
+from itertools import accumulate
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# Rows exposed to the view per fetchMore(); see TableModel
+FETCH_BATCH = 1000
+
+
+def fold_text(text):
+    """
+    Normalized form used for case-insensitive search: NFKC then casefold(),
+    so e.g. "STRASSE" finds "Straße" and full-width digits find ASCII ones.
+    """
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+class TableModel(QAbstractTableModel):
+    """
+    Read-only table stored column-wise (one list per column).
+
+    Cells are plain strings looked up as columns[col][row] in data(), so
+    the view only costs the cells Qt actually paints instead of one
+    QTableWidgetItem per cell. set_columns() expects str cells (as
+    manifest_to_table_rows() builds them); set_rows() converts any values.
+
+    Filtering happens in the model: set_filter() keeps the matching source
+    row numbers and data() maps through them, so a filter costs one list of
+    ints rather than a proxy call per source row.
+
+    Rows (filtered or not) are exposed to the view FETCH_BATCH at a time
+    through canFetchMore()/fetchMore() as it scrolls, so a reset only makes
+    the view map the first batch, not every row.
+
+    flags() is deliberately not overridden: the C++ default (Selectable |
+    Enabled, not editable) is what a read-only table wants, and a Python
+    override would cost a call per cell per paint.
+    """
+
+    def __init__(self, headers=(), columns=(), parent=None):
+        super().__init__(parent)
+        self._set(headers, columns)
+
+    def _set(self, headers, columns, loaded=FETCH_BATCH):
+        self._headers = list(headers)
+        self._cols = list(columns)
+        self._row_count = len(self._cols[0]) if self._cols else 0
+        # Source rows currently shown, in order; None shows every row
+        self._filtered = None
+        self._loaded = min(self._row_count, loaded)
+        self._search_buf = None
+        self._search_starts = None
+
+    def set_columns(self, headers, columns):
+        """
+        Swap in new data (which starts unfiltered).
+
+        With unchanged headers (e.g. re-viewing or reloading the same kind of
+        dump) the rows are updated in place: one remove/insert for the size
+        difference plus one dataChanged, so the view keeps its scroll position
+        and column state. Otherwise the view sees a single model reset.
+        """
+        headers = list(headers)
+        if not headers or headers != self._headers:
+            self.beginResetModel()
+            self._set(headers, columns)
+            self.endResetModel()
+            return
+
+        # Compare exposed rows; keep at least as many exposed as before
+        old = self._loaded
+        new = min(len(columns[0]) if columns else 0, max(old, FETCH_BATCH))
+        if new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            self._set(headers, columns, new)
+            self.endRemoveRows()
+        elif new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self._set(headers, columns, new)
+            self.endInsertRows()
+        else:
+            self._set(headers, columns, new)
+
+        kept = min(old, new)
+        if kept:
+            self.dataChanged.emit(self.index(0, 0), self.index(kept - 1, len(headers) - 1))
+
+    def set_rows(self, headers, rows):
+        """
+        set_columns() for a list of row sequences: transposed by zip and
+        stringified by map(str, ...), both in C, once per dataset rather than
+        per painted cell.
+        """
+        columns = [list(map(str, col)) for col in zip(*rows)] if rows else [[] for _ in headers]
+        self.set_columns(headers, columns)
+
+    def set_filter(self, rows):
+        """Show only the given source rows (any iterable), or all with None."""
+        self.beginResetModel()
+        self._filtered = sorted(rows) if rows is not None else None
+        self._loaded = min(self.visible_count(), FETCH_BATCH)
+        self.endResetModel()
+
+    def visible_count(self):
+        """Rows passing the current filter, fetched into the view or not."""
+        return self._row_count if self._filtered is None else len(self._filtered)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < self.visible_count()
+
+    def fetchMore(self, parent, count=FETCH_BATCH):
+        if parent.isValid():
+            return
+        count = min(count, self.visible_count() - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def _search_index(self):
+        """
+        All rows folded (fold_text) into one flat UTF-8 buffer plus each row's
+        start offset, built once per dataset on the first filter. \x1f
+        separates cells and \x1e rows, so a term never matches across a
+        boundary. Bytes keep the mostly-ASCII dump data at one byte per
+        character even when a single row holds wider text (which would widen
+        a str buffer to 2-4 bytes per character throughout).
+
+        Within a row the cells are keyed shortest column first (numbers and
+        dates before names and message bodies): match_rows() stops scanning
+        a row at its first hit, so a hit in a short leading field skips the
+        long trailing ones.
+        """
+        if self._search_buf is None:
+            order = sorted(self._cols, key=lambda col: sum(map(len, col)))
+            rows = zip(*order)
+            keys = [fold_text("\x1f".join(row)).encode("utf-8") for row in rows]
+            self._search_buf = b"\x1e".join(keys)
+            self._search_starts = [0, *accumulate(len(k) + 1 for k in keys)]
+        return self._search_buf, self._search_starts
+
+    def match_rows(self, term):
+        """
+        Set of rows containing `term` (already fold_text()-ed). One bytes.find
+        per hit over the flat buffer; each hit is mapped to its row by bisect
+        and the scan resumes at the next row. UTF-8 is self-synchronizing, so
+        a byte match is always a whole-character match.
+        """
+        buf, starts = self._search_index()
+        needle = term.encode("utf-8")
+        hits = set()
+        pos = buf.find(needle)
+        while pos != -1:
+            row = bisect_right(starts, pos) - 1
+            hits.add(row)
+            pos = buf.find(needle, starts[row + 1])
+        return hits
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        col = index.column()
+        if col >= len(self._cols):
+            return ""
+        row = index.row()
+        if self._filtered is not None:
+            row = self._filtered[row]
+        return self._cols[col][row]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if section < len(self._headers) else None
+        return str(section + 1)
+
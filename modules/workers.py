@@ -1,15 +1,26 @@
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 
-class Worker(QThread):
+class WorkerSignals(QObject):
     finished = pyqtSignal(object)
 
+class Worker(QRunnable):
+    """Runs fn() on a QThreadPool thread and emits its result via .finished"""
+
     def __init__(self, fn):
         super().__init__()
         self.fn = fn
+        # Created on the caller's (GUI) thread, so slots are delivered there
+        self.signals = WorkerSignals()
+        # The caller holds the reference until .finished has been handled
+        self.setAutoDelete(False)
+
+    @property
+    def finished(self):
+        return self.signals.finished
 
     def run(self):
         try:
             result = self.fn()
         except Exception as e:
             result = f"Error: {e}"
-        self.finished.emit(result)
+        self.signals.finished.emit(result)